@@ -0,0 +1,38 @@
+ckan.module("editable-config-filter", function ($) {
+  /**
+   * Hide groups and fields of config options that do not match the text of
+   * module host.
+   */
+  return {
+    options: {
+      target: null,
+    },
+
+    initialize() {
+      $.proxyAll(this, /_on/);
+
+      this.target = $(this.options.target);
+      this.el.on("input", this._onInput);
+      this.target.on("editable-config:loaded", this._onInput);
+    },
+
+    _onInput() {
+      const query = this.el.val().trim();
+
+      this.target.find(".editable-config-group").each((_idx, el) => {
+        const group = $(el);
+        const keys = String(group.data("keys")).split(" ");
+        const visible = !query || keys.some((key) => key.includes(query));
+        group.prop("hidden", !visible);
+      });
+
+      this.target.find(".editable-config-field").each((_idx, el) => {
+        const field = $(el);
+        field.prop(
+          "hidden",
+          Boolean(query) && !String(field.data("key")).includes(query),
+        );
+      });
+    },
+  };
+});
@@ -0,0 +1,49 @@
+ckan.module("editable-config-group", function ($) {
+  /**
+   * Collapsible group of config options. Fields are loaded from the server
+   * when group is expanded for the first time.
+   */
+  return {
+    options: {
+      url: null,
+      loaded: false,
+    },
+
+    initialize() {
+      $.proxyAll(this, /_on/);
+
+      this.fields = this.$(".editable-config-group--fields");
+      this.$(".editable-config-group--toggle").on("click", this._onToggle);
+      this.el.on("editable-config:expand", this._onExpand);
+    },
+
+    _onToggle(event) {
+      event.preventDefault();
+      if (this.fields.prop("hidden")) {
+        this._onExpand();
+      } else {
+        this.fields.prop("hidden", true);
+      }
+    },
+
+    _onExpand() {
+      this.fields.prop("hidden", false);
+      if (this.options.loaded || this.loading) {
+        return;
+      }
+
+      this.loading = $.getJSON(this.options.url)
+        .done((data) => {
+          this.fields.html(data.html);
+          this.fields.find("[data-module]").each((_idx, el) => {
+            ckan.module.initializeElement(el);
+          });
+          this.options.loaded = true;
+          this.el.trigger("editable-config:loaded");
+        })
+        .always(() => {
+          this.loading = null;
+        });
+    },
+  };
+});
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import datetime
+
+import click
+
+from ckan import model
+
+from . import config, shared
+from .model import History, Option
+from .model.option import db_now
+
+__all__ = ["editable_config"]
+
+
+@click.group(short_help="Manage editable config overrides")
+def editable_config():
+    pass
+
+
+@editable_config.command()
+@click.option(
+    "--ttl",
+    type=int,
+    help="Remove tombstones older than given number of seconds",
+)
+def purge_tombstones(ttl: int | None):
+    """Remove records about options that were reset long time ago."""
+    if ttl is None:
+        ttl = config.tombstone_ttl()
+
+    # tombstones are dated by DB, so the cutoff is computed by DB as well
+    before = db_now() - datetime.timedelta(seconds=ttl)
+    count = Option.purge_tombstones(before)
+    model.Session.commit()
+
+    click.secho(f"Removed tombstones: {count}", fg="green")
+
+
+@editable_config.command()
+@click.option(
+    "--keep",
+    type=int,
+    help="Number of the most recent records kept for every option",
+)
+@click.option(
+    "--ttl",
+    type=int,
+    help="Remove records older than given number of seconds",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=1000,
+    show_default=True,
+    help="Number of records removed by a single transaction",
+)
+def purge_history(keep: int | None, ttl: int | None, batch_size: int):
+    """Remove history records that exceed retention limits."""
+    if keep is None:
+        keep = config.history_keep()
+
+    if ttl is None:
+        ttl = config.history_ttl()
+
+    # records are dated by DB, so the cutoff is computed by DB as well
+    before = db_now() - datetime.timedelta(seconds=ttl) if ttl else None
+
+    total = 0
+    while count := History.prune(keep, before, batch_size):
+        model.Session.commit()
+        total += count
+
+    click.secho(f"Removed history records: {total}", fg="green")
+
+
+@editable_config.command()
+def reset_startup_marker():
+    """Repeat startup checks when the application starts next time."""
+    shared.set_startup_marker(None)
+    click.secho("Startup marker removed", fg="green")
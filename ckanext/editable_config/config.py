@@ -5,11 +5,26 @@ import ckan.plugins.toolkit as tk
 EXTRA_EDITABLE = "ckanext.editable_config.options.extra_editable"
 WHITELIST = "ckanext.editable_config.options.whitelist"
 BLACKLIST = "ckanext.editable_config.options.blacklist"
+HOT_SWAPPABLE = "ckanext.editable_config.options.hot_swappable"
+HOT_SWAPPABLE_FLAG = "ckanext.editable_config.hot_swappable_flag"
 CHARGE_TIMEOUT = "ckanext.editable_config.charge_timeout"
+CHARGE_JITTER = "ckanext.editable_config.charge_jitter"
+STALE_WHILE_REVALIDATE = "ckanext.editable_config.stale_while_revalidate"
+REFRESH_INTERVAL = "ckanext.editable_config.refresh_interval"
+SKIP_ENDPOINTS = "ckanext.editable_config.skip_endpoints"
+SKIP_PATHS = "ckanext.editable_config.skip_paths"
+VERSION_HEADER = "ckanext.editable_config.version_header"
+TOMBSTONE_TTL = "ckanext.editable_config.tombstone_ttl"
+HISTORY_KEEP = "ckanext.editable_config.history.keep"
+HISTORY_TTL = "ckanext.editable_config.history.ttl"
 REPLACE_CONFIG_TAB = "ckanext.editable_config.replace_admin_config_tab"
 DISABLE_CONFIG_TAB = "ckanext.editable_config.disable_admin_config_tab"
 CONVERT_CORE_OVERRIDES = "ckanext.editable_config.convert_core_overrides"
+SKIP_STARTUP_CHECKS = "ckanext.editable_config.skip_startup_checks"
 ADDITIONAL_VALIDATORS = "ckanext.editable_config.additional_validators"
+NOTIFIER = "ckanext.editable_config.notifier"
+METRICS = "ckanext.editable_config.metrics"
+VALIDATION_DEPENDENCIES = "ckanext.editable_config.validation_dependencies"
 
 
 def extra_editable() -> list[str]:
@@ -24,10 +39,54 @@ def blacklist() -> list[str]:
     return tk.config[BLACKLIST]
 
 
-def charge_timeout() -> int:
+def hot_swappable() -> list[str]:
+    return tk.config[HOT_SWAPPABLE]
+
+
+def hot_swappable_flag() -> str | None:
+    return tk.config[HOT_SWAPPABLE_FLAG]
+
+
+def charge_timeout() -> float:
     return tk.config[CHARGE_TIMEOUT]
 
 
+def charge_jitter() -> float:
+    return tk.config[CHARGE_JITTER]
+
+
+def stale_while_revalidate() -> bool:
+    return tk.config[STALE_WHILE_REVALIDATE]
+
+
+def refresh_interval() -> float:
+    return tk.config[REFRESH_INTERVAL]
+
+
+def skip_endpoints() -> list[str]:
+    return tk.config[SKIP_ENDPOINTS]
+
+
+def skip_paths() -> list[str]:
+    return tk.config[SKIP_PATHS]
+
+
+def version_header() -> str | None:
+    return tk.config[VERSION_HEADER]
+
+
+def tombstone_ttl() -> int:
+    return tk.config[TOMBSTONE_TTL]
+
+
+def history_keep() -> int:
+    return tk.config[HISTORY_KEEP]
+
+
+def history_ttl() -> int:
+    return tk.config[HISTORY_TTL]
+
+
 def replace_admin_config_tab() -> bool:
     return tk.config[REPLACE_CONFIG_TAB]
 
@@ -40,5 +99,24 @@ def convert_core_overrides() -> bool:
     return tk.config[CONVERT_CORE_OVERRIDES]
 
 
+def skip_startup_checks() -> bool:
+    return tk.config[SKIP_STARTUP_CHECKS]
+
+
 def additional_validators() -> dict[str, str]:
     return tk.config[ADDITIONAL_VALIDATORS]
+
+
+def validation_dependencies() -> dict[str, list[str]]:
+    return {
+        key: tk.aslist(value)
+        for key, value in tk.config[VALIDATION_DEPENDENCIES].items()
+    }
+
+
+def notifier() -> str:
+    return tk.config[NOTIFIER]
+
+
+def metrics() -> str:
+    return tk.config[METRICS]
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from typing import Any
 
+from markupsafe import Markup
+
 from ckan.common import config_declaration as cd
 
-from . import config
+from . import config, shared
 
 
 def editable_config_disable_admin_config_tab() -> bool:
@@ -24,3 +26,7 @@ def editable_config_option_description(name: Any) -> str | None:
         )
 
     return text
+
+
+def editable_config_rendered_option_description(name: str) -> Markup:
+    return shared.render_description(name)
@@ -1,18 +1,18 @@
 from __future__ import annotations
 
-from typing import Any
+import fnmatch
+from typing import Any, Collection, Iterable
 
 from typing_extensions import TypedDict
 
 import ckan.plugins.toolkit as tk
 from ckan import types
-from ckan.common import CKANConfig
-from ckan.common import config_declaration as cd
 from ckan.config.declaration.option import Flag
 from ckan.logic import validate
 
 from ckanext.editable_config import shared
-from ckanext.editable_config.model import Option
+from ckanext.editable_config.model import History, Option, Revision
+from ckanext.editable_config.notifier import get_notifier
 
 from . import schema
 
@@ -42,6 +42,30 @@ def editable_config_last_check(
     return {"last_check": last_check.isoformat()}
 
 
+@tk.side_effect_free
+def editable_config_version(
+    context: types.Context,
+    data_dict: dict[str, Any],
+) -> dict[str, Any]:
+    """Revision of config overrides.
+
+    Revision changes after every modification of config overrides, so it can
+    be used to check whether cached config is stale without listing all the
+    options.
+
+    Returns:
+      revision(int): the latest revision saved into DB
+      applied(int | None): revision applied by the current process
+
+    """
+    tk.check_access("editable_config_version", context, data_dict)
+
+    return {
+        "revision": Revision.current(),
+        "applied": shared.apply_config_overrides.revision,
+    }
+
+
 @tk.side_effect_free
 @validate(schema.editable_config_list)
 def editable_config_list(
@@ -51,25 +75,48 @@ def editable_config_list(
     """All editable config options. Every modified option includes dictionary
     containing override details.
 
+    Args:
+      pattern(str, optional): glob-pattern for option names. Default: `*`
+      limit(int, optional): max number of options in response
+      offset(int, optional): number of skipped options. Default: 0
+      fields(list[str], optional): details included into response. Allowed
+        values are `value` and `option`. Default: both
+      only_overridden(bool, optional): list only options that have
+        overrides. Default: false
+
     Returns:
-      editable option names(`dict[str, Any]`): dictionary with current
-      value and optional modification details
+      editable option names(`dict[str, Any]`): dictionary with requested
+      fields: current value and optional modification details
 
     """
     tk.check_access("editable_config_list", context, data_dict)
 
-    result: dict[str, Any] = {}
-    for key in cd.iter_options(pattern=data_dict["pattern"]):
-        option = cd[key]
-        if not option.has_flag(Flag.editable):
-            continue
+    pattern = data_dict["pattern"]
+    if data_dict["only_overridden"]:
+        # served directly from the overrides table, without iteration over
+        # all the declared options
+        keys = shared.sort_editable(
+            key for key in Option.overriden_keys() if fnmatch.fnmatchcase(key, pattern)
+        )
+    else:
+        keys = list(shared.iter_editable(pattern))
 
-        skey = str(key)
+    offset = data_dict["offset"]
+    limit = data_dict.get("limit")
+    keys = keys[offset : offset + limit if limit is not None else None]
 
-        result[skey] = {
-            "value": shared.value_as_string(skey, tk.config[skey]),
-            "option": opt.as_dict(context) if (opt := Option.get(skey)) else None,
-        }
+    fields = data_dict["fields"]
+    overrides = Option.get_many(keys) if "option" in fields else {}
+
+    result: dict[str, Any] = {}
+    for key in keys:
+        result[key] = {}
+        if "value" in fields:
+            result[key]["value"] = shared.value_as_string(key, tk.config[key])
+
+        if "option" in fields:
+            opt = overrides.get(key)
+            result[key]["option"] = opt.as_dict(context) if opt else None
 
     return result
 
@@ -79,26 +126,46 @@ def editable_config_update(
     context: types.Context,
     data_dict: dict[str, Any],
 ) -> UpdateResult:
+    """Apply change, revert and reset inside a single transaction.
+
+    Everything is validated before any modification, so either all the
+    modifications are saved or none of them. Changes that do not modify the
+    value of the option are ignored.
+    """
     tk.check_access("editable_config_update", context, data_dict)
+    sess = context["session"]
+
+    changes, unchanged = _split_noop(data_dict["change"])
+    _validate_change(changes)
+    reverted = _get_existing(data_dict["revert"])
+    _validate_revert(reverted)
+    removed = _get_existing(data_dict["reset"])
 
     result: UpdateResult = {
-        "change": {},
+        "change": _dictize(unchanged.values(), context),
         "revert": {},
         "reset": {},
     }
-
-    result["change"] = tk.get_action("editable_config_change")(
-        tk.fresh_context(context),
-        {"options": data_dict["change"], "apply": False},
-    )
-    result["revert"] = tk.get_action("editable_config_revert")(
-        tk.fresh_context(context),
-        {"keys": data_dict["revert"], "apply": False},
-    )
-    result["reset"] = tk.get_action("editable_config_reset")(
-        tk.fresh_context(context),
-        {"keys": data_dict["reset"], "apply": False},
+    if not (changes or reverted or removed):
+        return result
+
+    History.record(
+        Revision.bump(),
+        {
+            **_as_strings(changes),
+            **{key: option.prev_value for key, option in reverted.items()},
+            **dict.fromkeys(removed),
+        },
+        context.get("user"),
     )
+    result["change"].update(_dictize(Option.set_many(changes), context))
+    result["revert"] = _dictize(Option.revert_many(reverted), context)
+    result["reset"] = _dictize(removed.values(), context)
+    Option.reset_many(removed)
+
+    _register_changes([*changes, *result["revert"], *result["reset"]])
+    if not context.get("defer_commit"):
+        sess.commit()
 
     if data_dict["apply"]:
         shared.apply_config_overrides()
@@ -113,16 +180,18 @@ def editable_config_change(
 ) -> dict[str, shared.OptionDict]:
     tk.check_access("editable_config_change", context, data_dict)
     sess = context["session"]
-    options: list[Option] = []
 
-    for k, v in data_dict["options"].items():
-        options.append(_make_option(k, v))
+    changes, unchanged = _split_noop(data_dict["options"])
+    _validate_change(changes)
+
+    result = _dictize(unchanged.values(), context)
+    if not changes:
+        return result
 
-    result: dict[str, shared.OptionDict] = {}
-    for option in options:
-        sess.add(option)
-        result[option.key] = option.as_dict(tk.fresh_context(context))
+    History.record(Revision.bump(), _as_strings(changes), context.get("user"))
+    result.update(_dictize(Option.set_many(changes), context))
 
+    _register_changes(changes)
     if not context.get("defer_commit"):
         sess.commit()
 
@@ -132,16 +201,94 @@ def editable_config_change(
     return result
 
 
-def _make_option(key: str, value: Any):
+def _register_changes(keys: Collection[str]):
+    """Notify other processes about modified options.
+
+    Every action must call `Revision.bump` before modification of options.
+    Bump locks the revision row till the end of transaction, so concurrent
+    modifications are serialized and modification dates of options grow in
+    the same order as transactions are committed. That's what allows
+    processes to use the latest observed modification date as a watermark
+    for change detection.
+    """
+    get_notifier().notify(keys)
+
+    # notifications from the DB are asynchronous. Current process must see
+    # changes immediately, when they are applied by the action.
+    shared.apply_config_overrides.mark_dirty(list(keys))
+
+
+def _dictize(
+    options: Iterable[Option],
+    context: types.Context,
+) -> dict[str, shared.OptionDict]:
+    return {option.key: option.as_dict(tk.fresh_context(context)) for option in options}
+
+
+def _as_strings(options: dict[str, Any]) -> dict[str, str]:
+    return {key: shared.value_as_string(key, value) for key, value in options.items()}
+
+
+def _check_editable(key: str):
     option = shared.get_declaration(key)
     if not option or not option.has_flag(Flag.editable):
         raise tk.ValidationError({key: ["Not editable"]})
 
-    _, errors = cd.validate(CKANConfig(tk.config, **{key: value}))
-    if errors:
+
+def _split_noop(options: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Option]]:
+    """Separate real changes from values that are already in use.
+
+    Returns values that modify options and existing overrides that already
+    have the requested value. Non-editable options are rejected before
+    comparison.
+    """
+    for key in options:
+        _check_editable(key)
+
+    overrides = Option.get_many(list(options))
+    changes: dict[str, Any] = {}
+    unchanged: dict[str, Option] = {}
+
+    for key, value in options.items():
+        if key in overrides:
+            current = overrides[key].value
+        else:
+            # config of the current process may still contain override that
+            # was reset by another process
+            source = shared.apply_config_overrides.source_value(key)
+            current = shared.value_as_string(key, source)
+
+        if shared.value_as_string(key, value) != current:
+            changes[key] = value
+        elif key in overrides:
+            unchanged[key] = overrides[key]
+
+    return changes, unchanged
+
+
+def _validate_change(options: dict[str, Any]):
+    for key in options:
+        _check_editable(key)
+
+    if errors := shared.validate_options(options):
         raise tk.ValidationError(errors)
 
-    return Option.set(key, value)
+
+def _get_existing(keys: list[str]) -> dict[str, Option]:
+    options = Option.get_many(keys)
+    for key in keys:
+        if key not in options:
+            raise tk.ObjectNotFound(key)
+
+    return options
+
+
+def _validate_revert(options: dict[str, Option]):
+    errors = shared.validate_options(
+        {key: option.prev_value for key, option in options.items()},
+    )
+    if errors:
+        raise tk.ValidationError(errors)
 
 
 @validate(schema.editable_config_option_save)
@@ -152,12 +299,22 @@ def editable_config_option_save(
     tk.check_access("editable_config_option_save", context, data_dict)
     sess = context["session"]
 
-    option = _make_option(data_dict["key"], data_dict["value"])
+    _validate_change({data_dict["key"]: data_dict["value"]})
+
+    History.record(
+        Revision.bump(),
+        _as_strings({data_dict["key"]: data_dict["value"]}),
+        context.get("user"),
+    )
+    option = Option.set(data_dict["key"], data_dict["value"])
     if "prev_value" in data_dict:
         option.prev_value = data_dict["prev_value"]
 
     sess.add(option)
+    # modification date is computed by DB during flush
+    sess.flush()
 
+    _register_changes([option.key])
     if not context.get("defer_commit"):
         sess.commit()
 
@@ -173,25 +330,19 @@ def editable_config_revert(
     data_dict: dict[str, Any],
 ) -> dict[str, shared.OptionDict]:
     tk.check_access("editable_config_revert", context, data_dict)
-
     sess = context["session"]
-    result: dict[str, shared.OptionDict] = {}
-    options: list[Option] = []
 
-    for key in data_dict["keys"]:
-        if option := Option.get(key):
-            _, errors = cd.validate(CKANConfig(tk.config, **{key: option.prev_value}))
-            if errors:
-                raise tk.ValidationError(errors)
+    options = _get_existing(data_dict["keys"])
+    _validate_revert(options)
 
-            options.append(option)
-        else:
-            raise tk.ObjectNotFound(key)
-
-    for option in options:
-        option.revert()
-        result[option.key] = option.as_dict(tk.fresh_context(context))
+    History.record(
+        Revision.bump(),
+        {key: option.prev_value for key, option in options.items()},
+        context.get("user"),
+    )
+    result = _dictize(Option.revert_many(options), context)
 
+    _register_changes(result)
     if not context.get("defer_commit"):
         sess.commit()
 
@@ -208,19 +359,14 @@ def editable_config_reset(
 ) -> dict[str, shared.OptionDict]:
     tk.check_access("editable_config_reset", context, data_dict)
     sess = context["session"]
-    result: dict[str, shared.OptionDict] = {}
-    options: list[Option] = []
 
-    for key in data_dict["keys"]:
-        if option := Option.get(key):
-            options.append(option)
-        else:
-            raise tk.ObjectNotFound(key)
+    options = _get_existing(data_dict["keys"])
 
-    for option in options:
-        sess.delete(option)
-        result[option.key] = option.as_dict(tk.fresh_context(context))
+    History.record(Revision.bump(), dict.fromkeys(options), context.get("user"))
+    result = _dictize(options.values(), context)
+    Option.reset_many(options)
 
+    _register_changes(result)
     if not context.get("defer_commit"):
         sess.commit()
 
@@ -230,6 +376,83 @@ def editable_config_reset(
     return result
 
 
+@tk.side_effect_free
+@validate(schema.editable_config_history)
+def editable_config_history(
+    context: types.Context,
+    data_dict: dict[str, Any],
+) -> dict[str, Any]:
+    """Modifications of config overrides in reverse chronological order.
+
+    Every record contains option's override before(`prev_value`) and
+    after(`value`) the modification. `null` means that option is not
+    overriden.
+
+    Args:
+      key(str, optional): name of the option
+      since(int, optional): include only revisions after the given one
+      limit(int, optional): max number of records in response. Default: 20
+      offset(int, optional): number of skipped records. Default: 0
+
+    Returns:
+      count(int): total number of records
+      results(list[dict[str, Any]]): history records
+      horizon(int): the latest revision removed from history. Older
+        revisions cannot be restored
+
+    """
+    tk.check_access("editable_config_history", context, data_dict)
+
+    q = History.search(data_dict.get("key"), data_dict.get("since"))
+    records = q.offset(data_dict["offset"]).limit(data_dict["limit"])
+
+    return {
+        "count": q.count(),
+        "results": [record.as_dict(context) for record in records],
+        "horizon": History.horizon(),
+    }
+
+
+@validate(schema.editable_config_rollback)
+def editable_config_rollback(
+    context: types.Context,
+    data_dict: dict[str, Any],
+) -> UpdateResult:
+    """Restore config overrides as they were at the given revision.
+
+    Options modified after the revision get their previous values and
+    options that were not overriden at that moment are reset. Rollback is
+    saved as a new revision, so it can be rolled back as well.
+
+    Args:
+      revision(int): restored revision
+      apply(bool, optional): apply changes immediately. Default: true
+
+    """
+    tk.check_access("editable_config_rollback", context, data_dict)
+
+    revision = data_dict["revision"]
+    if revision > Revision.current():
+        raise tk.ValidationError({"revision": ["Revision does not exist"]})
+
+    if revision < (horizon := History.horizon()):
+        raise tk.ValidationError(
+            {"revision": [f"History before revision {horizon} is removed"]},
+        )
+
+    state = History.state_at(revision)
+    overrides = Option.get_many(list(state))
+
+    return tk.get_action("editable_config_update")(
+        tk.fresh_context(context),
+        {
+            "change": {key: value for key, value in state.items() if value is not None},
+            "reset": [key for key in overrides if state[key] is None],
+            "apply": data_dict["apply"],
+        },
+    )
+
+
 @validate(schema.editable_config_apply)
 def editable_config_apply(
     context: types.Context,
@@ -19,6 +19,13 @@ def editable_config_last_check(
     return authz.is_authorized("editable_config_access", context, data_dict)
 
 
+def editable_config_version(
+    context: types.Context,
+    data_dict: dict[str, Any],
+) -> types.AuthResult:
+    return authz.is_authorized("editable_config_access", context, data_dict)
+
+
 def editable_config_list(
     context: types.Context,
     data_dict: dict[str, Any],
@@ -61,6 +68,20 @@ def editable_config_reset(
     return authz.is_authorized("editable_config_access", context, data_dict)
 
 
+def editable_config_history(
+    context: types.Context,
+    data_dict: dict[str, Any],
+) -> types.AuthResult:
+    return authz.is_authorized("editable_config_access", context, data_dict)
+
+
+def editable_config_rollback(
+    context: types.Context,
+    data_dict: dict[str, Any],
+) -> types.AuthResult:
+    return authz.is_authorized("editable_config_access", context, data_dict)
+
+
 def editable_config_apply(
     context: types.Context,
     data_dict: dict[str, Any],
@@ -8,8 +8,25 @@ from ckan.logic.schema import validator_args
 def editable_config_list(
     default: types.ValidatorFactory,
     unicode_safe: types.Validator,
+    ignore_missing: types.Validator,
+    natural_number_validator: types.Validator,
+    json_list_or_string: types.Validator,
+    list_of_strings: types.Validator,
+    boolean_validator: types.Validator,
+    editable_config_list_fields: types.Validator,
 ) -> types.Schema:
-    return {"pattern": [default("*"), unicode_safe]}
+    return {
+        "pattern": [default("*"), unicode_safe],
+        "limit": [ignore_missing, natural_number_validator],
+        "offset": [default(0), natural_number_validator],
+        "fields": [
+            default("value,option"),
+            json_list_or_string,
+            list_of_strings,
+            editable_config_list_fields,
+        ],
+        "only_overridden": [default(False), boolean_validator],
+    }
 
 
 @validator_args
@@ -84,6 +101,34 @@ def editable_config_reset(
     }
 
 
+@validator_args
+def editable_config_history(
+    default: types.ValidatorFactory,
+    unicode_safe: types.Validator,
+    ignore_missing: types.Validator,
+    natural_number_validator: types.Validator,
+) -> types.Schema:
+    return {
+        "key": [ignore_missing, unicode_safe],
+        "since": [ignore_missing, natural_number_validator],
+        "limit": [default(20), natural_number_validator],
+        "offset": [default(0), natural_number_validator],
+    }
+
+
+@validator_args
+def editable_config_rollback(
+    default: types.ValidatorFactory,
+    not_missing: types.Validator,
+    natural_number_validator: types.Validator,
+    boolean_validator: types.Validator,
+) -> types.Schema:
+    return {
+        "revision": [not_missing, natural_number_validator],
+        "apply": [default(True), boolean_validator],
+    }
+
+
 @validator_args
 def editable_config_apply(
     json_list_or_string: types.Validator,
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Any
+
+import ckan.plugins.toolkit as tk
+
+LIST_FIELDS = ("value", "option")
+
+
+def editable_config_list_fields(value: list[str]) -> list[str]:
+    """Check that all fields are supported by editable_config_list."""
+    value = [field for field in value if field]
+    if unknown := set(value) - set(LIST_FIELDS):
+        fields = ", ".join(sorted(unknown))
+        raise tk.Invalid(f"Unsupported fields: {fields}")  # noqa: TRY003
+
+    return value
+
+
+def editable_config_non_negative_float(value: Any) -> float:
+    """Convert value into non-negative float."""
+    try:
+        result = float(value)
+    except (TypeError, ValueError) as err:
+        raise tk.Invalid("Must be a number") from err  # noqa: TRY003
+
+    if result < 0:
+        raise tk.Invalid("Must be a non-negative number")  # noqa: TRY003
+
+    return result
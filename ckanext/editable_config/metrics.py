@@ -0,0 +1,128 @@
+"""Metrics of the change detection.
+
+Metrics are reported to the sink configured by
+`ckanext.editable_config.metrics`. Sink is either one of the built-in
+sinks(`none`, `memory`) or import path of the custom `Sink` subclass in
+`package.module:Class` form. Custom sink is the place where metrics are
+forwarded into StatsD, Prometheus client, etc.
+
+Reported metrics:
+
+* counters(`Sink.increment`):
+
+  * `checks`: change detection cycles that accessed DB
+  * `checks_skipped.charge_timeout`: calls ignored because of
+    `charge_timeout`
+  * `checks_skipped.notifier`: calls ignored because notifier didn't report
+    any changes
+  * `db_queries`: queries issued by change detection
+  * `keys_changed`: modified options applied to config
+  * `keys_reset`: reset options removed from config
+  * `plugins_updates`: plugins reloads caused by modified options
+
+* histograms(`Sink.observe`), in seconds:
+
+  * `apply_changes_seconds`: collection of modified options
+  * `remove_keys_seconds`: full synchronization of reset options
+  * `plugins_update_seconds`: plugins reload
+  * `source_reload_seconds`: parsing of the config file
+
+"""
+from __future__ import annotations
+
+import contextlib
+import importlib
+import logging
+import time
+from collections import defaultdict
+from typing import Iterator
+
+from . import config
+
+log = logging.getLogger(__name__)
+
+
+class Sink:
+    """Base sink that ignores all metrics."""
+
+    def increment(self, name: str, value: float = 1):
+        """Increase the counter."""
+
+    def observe(self, name: str, value: float):
+        """Record the value of histogram."""
+
+
+class MemorySink(Sink):
+    """Sink that keeps metrics in memory of the current process.
+
+    Suitable for tests and debugging.
+
+    """
+
+    def __init__(self):
+        self.counters: dict[str, float] = defaultdict(float)
+        self.observations: dict[str, list[float]] = defaultdict(list)
+
+    def increment(self, name: str, value: float = 1):
+        self.counters[name] += value
+
+    def observe(self, name: str, value: float):
+        self.observations[name].append(value)
+
+    def reset(self):
+        """Remove all collected metrics."""
+        self.counters.clear()
+        self.observations.clear()
+
+
+_sinks: dict[str, type[Sink]] = {
+    "none": Sink,
+    "memory": MemorySink,
+}
+_current: tuple[str, Sink] | None = None
+
+
+def get_sink() -> Sink:
+    """Return metrics sink configured by the application."""
+    global _current  # noqa: PLW0603
+
+    name = config.metrics()
+    if _current and _current[0] == name:
+        return _current[1]
+
+    _current = (name, _make_sink(name))
+    return _current[1]
+
+
+def _make_sink(name: str) -> Sink:
+    if name in _sinks:
+        return _sinks[name]()
+
+    module, _sep, attr = name.partition(":")
+    try:
+        factory = getattr(importlib.import_module(module), attr)
+    except (ImportError, AttributeError):
+        log.exception("Cannot import metrics sink %s. Metrics are disabled", name)
+        return Sink()
+
+    return factory()
+
+
+def increment(name: str, value: float = 1):
+    """Increase the counter using configured sink."""
+    get_sink().increment(name, value)
+
+
+def observe(name: str, value: float):
+    """Record the value of histogram using configured sink."""
+    get_sink().observe(name, value)
+
+
+@contextlib.contextmanager
+def timer(name: str) -> Iterator[None]:
+    """Record the duration of the block as histogram value."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start)
@@ -0,0 +1,28 @@
+"""create_editable_config_revision_table
+
+Revision ID: 3c5e4f1b2a90
+Revises: a8d116986c3f
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3c5e4f1b2a90"
+down_revision = "a8d116986c3f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    table = op.create_table(
+        "editable_config_revision",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("value", sa.BigInteger, nullable=False),
+    )
+    op.bulk_insert(table, [{"id": 1, "value": 0}])
+
+
+def downgrade():
+    op.drop_table("editable_config_revision")
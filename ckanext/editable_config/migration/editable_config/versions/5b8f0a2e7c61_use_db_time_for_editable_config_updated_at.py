@@ -0,0 +1,31 @@
+"""use_db_time_for_editable_config_updated_at
+
+Revision ID: 5b8f0a2e7c61
+Revises: e41a7c5d9b28
+Create Date: 2026-10-18 12:31:52.870146
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b8f0a2e7c61"
+down_revision = "e41a7c5d9b28"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column(
+        "editable_config_option",
+        "updated_at",
+        server_default=sa.text("timezone('utc', clock_timestamp())"),
+    )
+
+
+def downgrade():
+    op.alter_column(
+        "editable_config_option",
+        "updated_at",
+        server_default=None,
+    )
@@ -0,0 +1,29 @@
+"""add_editable_config_updated_at_index
+
+Revision ID: 7d2b9e6c4f13
+Revises: 3c5e4f1b2a90
+Create Date: 2026-10-18 11:04:27.518340
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7d2b9e6c4f13"
+down_revision = "3c5e4f1b2a90"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "idx_editable_config_option_updated_at",
+        "editable_config_option",
+        ["updated_at"],
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "idx_editable_config_option_updated_at",
+        "editable_config_option",
+    )
@@ -0,0 +1,47 @@
+"""create_editable_config_history_table
+
+Revision ID: 9e4c2b7a1d53
+Revises: 5b8f0a2e7c61
+Create Date: 2026-10-18 15:22:09.604127
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9e4c2b7a1d53"
+down_revision = "5b8f0a2e7c61"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "editable_config_history",
+        sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=True),
+        sa.Column("key", sa.Text, nullable=False),
+        sa.Column("value", sa.Text, nullable=True),
+        sa.Column("prev_value", sa.Text, nullable=True),
+        sa.Column("revision", sa.BigInteger, nullable=False),
+        sa.Column("actor", sa.Text, nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime,
+            nullable=False,
+            server_default=sa.text("timezone('utc', clock_timestamp())"),
+        ),
+    )
+    op.create_index(
+        "idx_editable_config_history_key_revision",
+        "editable_config_history",
+        ["key", "revision"],
+    )
+
+
+def downgrade():
+    op.drop_table("editable_config_history")
+    op.execute(
+        sa.text(
+            "DELETE FROM system_info WHERE key = 'editable_config_history_horizon'",
+        ),
+    )
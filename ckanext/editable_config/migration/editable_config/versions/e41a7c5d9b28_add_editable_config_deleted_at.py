@@ -0,0 +1,29 @@
+"""add_editable_config_deleted_at
+
+Revision ID: e41a7c5d9b28
+Revises: 7d2b9e6c4f13
+Create Date: 2026-10-18 11:47:09.204113
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e41a7c5d9b28"
+down_revision = "7d2b9e6c4f13"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "editable_config_option",
+        sa.Column("deleted_at", sa.DateTime, nullable=True),
+    )
+
+
+def downgrade():
+    op.execute(
+        sa.text("DELETE FROM editable_config_option WHERE deleted_at IS NOT NULL"),
+    )
+    op.drop_column("editable_config_option", "deleted_at")
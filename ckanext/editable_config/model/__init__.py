@@ -1,3 +1,10 @@
+from .history import History
 from .option import Option
+from .revision import Revision
 
-__all__ = ["Option"]
+# the latest alembic revision of the plugin. Update it together with every
+# new migration: it's a part of the fingerprint that identifies verified
+# deployment.
+MIGRATION_HEAD = "9e4c2b7a1d53"
+
+__all__ = ["History", "Option", "Revision", "MIGRATION_HEAD"]
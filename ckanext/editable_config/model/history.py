@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Mapping, cast
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Mapped
+from typing_extensions import Self, TypedDict
+
+import ckan.plugins.toolkit as tk
+from ckan import model, types
+from ckan.lib.dictization import table_dictize
+
+from .option import Option, db_now
+
+# system_info record with the latest revision removed from history
+HORIZON_KEY = "editable_config_history_horizon"
+
+
+class HistoryDict(TypedDict):
+    id: int
+    key: str
+    value: str | None
+    prev_value: str | None
+    revision: int
+    actor: str | None
+    created_at: str
+
+
+class History(tk.BaseModel):  # pyright: ignore[reportUntypedBaseClass]
+    """Append-only log of modifications of config overrides.
+
+    Every record contains the override before and after the modification.
+    `None` means that option was not overriden, so reset is recorded as a
+    change from the value to `None`.
+
+    """
+
+    __table__ = sa.Table(
+        "editable_config_history",
+        tk.BaseModel.metadata,
+        sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=True),
+        sa.Column("key", sa.Text, nullable=False),
+        sa.Column("value", sa.Text, nullable=True),
+        sa.Column("prev_value", sa.Text, nullable=True),
+        sa.Column("revision", sa.BigInteger, nullable=False),
+        sa.Column("actor", sa.Text, nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime,
+            nullable=False,
+            server_default=db_now(),
+        ),
+        sa.Index("idx_editable_config_history_key_revision", "key", "revision"),
+    )
+
+    id: Mapped[int]
+    key: Mapped[str]
+    value: Mapped[str | None]
+    prev_value: Mapped[str | None]
+    revision: Mapped[int]
+    actor: Mapped[str | None]
+    created_at: Mapped[datetime]
+
+    @classmethod
+    def record(
+        cls,
+        revision: int,
+        values: Mapping[str, str | None],
+        actor: str | None = None,
+    ):
+        """Save new values of options modified by the given revision.
+
+        Must be called before modification, because previous values are taken
+        from the current state of overrides.
+        """
+        if not values:
+            return
+
+        overrides = Option.get_many(list(values))
+        rows = [
+            {
+                "key": key,
+                "value": value,
+                "prev_value": overrides[key].value if key in overrides else None,
+                "revision": revision,
+                "actor": actor or None,
+            }
+            for key, value in values.items()
+        ]
+        model.Session.execute(sa.insert(cls.__table__).values(rows))
+
+    @classmethod
+    def search(
+        cls,
+        key: str | None = None,
+        since: int | None = None,
+    ) -> types.Query[Self]:
+        """Records in reverse chronological order.
+
+        Optionally, records are filtered by option name and only revisions
+        after `since` are included.
+        """
+        q = model.Session.query(cls)
+        if key:
+            q = q.filter(cls.key == key)
+
+        if since is not None:
+            q = q.filter(cls.revision > since)
+
+        return q.order_by(cls.revision.desc(), cls.id.desc())
+
+    @classmethod
+    def state_at(cls, revision: int) -> dict[str, str | None]:
+        """Overrides of options modified after the given revision, as they
+        were at the moment of this revision.
+
+        Previous value of the first modification after the revision is the
+        state of the option at this revision, so the whole state is collected
+        by a single query.
+
+        """
+        table = cls.__table__
+        stmt = (
+            sa.select(table.c.key, table.c.prev_value)
+            .distinct(table.c.key)
+            .where(table.c.revision > revision)
+            .order_by(table.c.key, table.c.revision, table.c.id)
+        )
+        return {key: value for key, value in model.Session.execute(stmt)}
+
+    @classmethod
+    def horizon(cls) -> int:
+        """The latest revision removed from history.
+
+        State of overrides can be restored only for revisions that are not
+        older than horizon.
+        """
+        table = model.system_info_table
+        stmt = sa.select(table.c.value).where(table.c.key == HORIZON_KEY)
+        return int(model.Session.scalar(stmt) or 0)
+
+    @classmethod
+    def prune(
+        cls,
+        keep: int,
+        before: datetime | sa.sql.ColumnElement[datetime] | None,
+        batch_size: int,
+    ) -> int:
+        """Remove a batch of records that exceed retention limits.
+
+        Records are removed if there are more than `keep` newer records of
+        the same option or if they were created before the given moment.
+        Zero `keep` and empty `before` disable the corresponding limit.
+        Horizon is moved to the latest removed revision, but changes are not
+        committed.
+
+        """
+        table = cls.__table__
+        position = (
+            sa.func.row_number()
+            .over(
+                partition_by=table.c.key,
+                order_by=(table.c.revision.desc(), table.c.id.desc()),
+            )
+            .label("position")
+        )
+        ranked = sa.select(table.c.id, table.c.created_at, position).subquery()
+
+        conditions: list[Any] = []
+        if keep:
+            conditions.append(ranked.c.position > keep)
+
+        if before is not None:
+            conditions.append(ranked.c.created_at < before)
+
+        if not conditions:
+            return 0
+
+        ids = sa.select(ranked.c.id).where(sa.or_(*conditions)).limit(batch_size)
+        stmt = sa.delete(table).where(table.c.id.in_(ids)).returning(table.c.revision)
+        revisions = list(model.Session.scalars(stmt))
+        if revisions and (latest := max(revisions)) > cls.horizon():
+            cls._set_horizon(latest)
+
+        return len(revisions)
+
+    @classmethod
+    def _set_horizon(cls, revision: int):
+        table = model.system_info_table
+        stmt = insert(table).values(
+            key=HORIZON_KEY,
+            value=str(revision),
+            state=model.State.ACTIVE,
+        )
+        model.Session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.key],
+                set_={"value": stmt.excluded.value},
+            ),
+        )
+
+    def as_dict(self, context: types.Context) -> HistoryDict:
+        """Convert record into form appropriate for API response."""
+        return cast(HistoryDict, table_dictize(self, context))
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, cast
+from typing import Any, Collection, cast
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Mapped
 from typing_extensions import Self
 
@@ -14,36 +15,75 @@ from ckan.lib.dictization import table_dictize
 from ckanext.editable_config import shared
 
 
+def db_now() -> Any:
+    """Current UTC time according to DB.
+
+    Clocks of different nodes can drift, so modification dates are always
+    taken from the single source. Unlike `now()`, `clock_timestamp()` is not
+    frozen at the start of the transaction.
+    """
+    return sa.func.timezone("utc", sa.func.clock_timestamp())
+
+
 class Option(tk.BaseModel):  # pyright: ignore[reportUntypedBaseClass]
     __table__ = sa.Table(
         "editable_config_option",
         tk.BaseModel.metadata,
         sa.Column("key", sa.Text, primary_key=True),
         sa.Column("value", sa.Text, nullable=False),
-        sa.Column("updated_at", sa.DateTime, nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime,
+            nullable=False,
+            server_default=db_now(),
+        ),
         sa.Column("prev_value", sa.Text, nullable=False),
+        sa.Column("deleted_at", sa.DateTime, nullable=True),
+        sa.Index("idx_editable_config_option_updated_at", "updated_at"),
     )
 
     key: Mapped[str]
     value: Mapped[str]
     updated_at: Mapped[datetime]
     prev_value: Mapped[str]
+    deleted_at: Mapped[datetime | None]
 
     @classmethod
     def get(cls, key: str) -> Self | None:
-        """Search for option."""
-        return cast(
-            Self,
-            model.Session.get(cls, key),
+        """Search for option. Reset options are ignored."""
+        option: Self | None = model.Session.get(cls, key)
+        if option and option.deleted_at:
+            return None
+
+        return option
+
+    @classmethod
+    def get_many(cls, keys: Collection[str]) -> dict[str, Self]:
+        """Search for multiple options using a single query."""
+        if not keys:
+            return {}
+
+        q = model.Session.query(cls).filter(
+            cls.key.in_(keys),
+            cls.deleted_at.is_(None),
         )
+        return {option.key: option for option in q}
+
+    @classmethod
+    def overriden_keys(cls) -> set[str]:
+        """Names of all overriden options."""
+        stmt = sa.select(cls.key).where(cls.deleted_at.is_(None))
+        return set(model.Session.scalars(stmt))
 
     @classmethod
     def set(cls, key: str, value: Any) -> Self:
         """Create/update an option."""
         safe_value = shared.value_as_string(key, value)
 
-        if option := cls.get(key):
+        # tombstone of the reset option is re-used
+        if option := model.Session.get(cls, key):
             option.value = safe_value
+            option.deleted_at = None
         else:
             option = cls(key=key, value=safe_value)
 
@@ -52,9 +92,113 @@ class Option(tk.BaseModel):  # pyright: ignore[reportUntypedBaseClass]
 
         return option
 
+    @classmethod
+    def set_many(cls, values: dict[str, Any]) -> list[Self]:
+        """Create/update multiple options using a single statement."""
+        if not values:
+            return []
+
+        now = db_now()
+        rows = [
+            {
+                "key": key,
+                "value": shared.value_as_string(key, value),
+                "prev_value": shared.value_as_string(key, tk.config[key]),
+                "updated_at": now,
+                "deleted_at": None,
+            }
+            for key, value in values.items()
+        ]
+
+        stmt = insert(cls.__table__).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cls.__table__.c.key],
+            set_={
+                "value": stmt.excluded.value,
+                "prev_value": stmt.excluded.prev_value,
+                "updated_at": stmt.excluded.updated_at,
+                "deleted_at": None,
+            },
+        )
+        return cls._execute_returning(stmt)
+
+    @classmethod
+    def revert_many(cls, keys: Collection[str]) -> list[Self]:
+        """Swap current and previous values of multiple options using a single
+        statement.
+
+        """
+        if not keys:
+            return []
+
+        table = cls.__table__
+        stmt = (
+            sa.update(table)
+            .where(table.c.key.in_(keys), table.c.deleted_at.is_(None))
+            .values(
+                value=table.c.prev_value,
+                prev_value=table.c.value,
+                updated_at=db_now(),
+            )
+        )
+        return cls._execute_returning(stmt)
+
+    @classmethod
+    def reset_many(cls, keys: Collection[str]) -> list[Self]:
+        """Replace multiple options with tombstones using a single statement.
+
+        Tombstone keeps the row in the table with the modification date, so
+        reset is detected by `updated_since` in the same way as any other
+        change.
+
+        """
+        if not keys:
+            return []
+
+        now = db_now()
+        table = cls.__table__
+        stmt = (
+            sa.update(table)
+            .where(table.c.key.in_(keys), table.c.deleted_at.is_(None))
+            .values(deleted_at=now, updated_at=now)
+        )
+        return cls._execute_returning(stmt)
+
+    @classmethod
+    def purge_tombstones(
+        cls,
+        before: datetime | sa.sql.ColumnElement[datetime],
+    ) -> int:
+        """Remove tombstones of options that were reset before the given
+        moment.
+
+        Moment can be an SQL expression, e.g. based on `db_now()`, to avoid
+        comparison of dates produced by different clocks.
+
+        """
+        table = cls.__table__
+        stmt = sa.delete(table).where(table.c.deleted_at < before)
+        return model.Session.execute(stmt).rowcount
+
+    @classmethod
+    def _execute_returning(cls, stmt: Any) -> list[Self]:
+        """Execute DML statement and return affected options.
+
+        Options that are already loaded into session are refreshed.
+        """
+        q = (
+            sa.select(cls)
+            .from_statement(stmt.returning(*cls.__table__.c))
+            .execution_options(populate_existing=True)
+        )
+        return list(model.Session.scalars(q))
+
     def touch(self):
-        """Update modification date of the option."""
-        self.updated_at = datetime.utcnow()
+        """Update modification date of the option.
+
+        Date is computed by DB when option is flushed, without extra query.
+        """
+        self.updated_at = db_now()
 
     def revert(self):
         """Swap current and previous values of the option."""
@@ -63,7 +207,9 @@ class Option(tk.BaseModel):  # pyright: ignore[reportUntypedBaseClass]
 
     def as_dict(self, context: types.Context) -> shared.OptionDict:
         """Convert option object into form appropriate for API response."""
-        return cast(shared.OptionDict, table_dictize(self, context))
+        data = table_dictize(self, context)
+        data.pop("deleted_at", None)
+        return cast(shared.OptionDict, data)
 
     @classmethod
     def is_updated_since(cls, last_update: datetime | None) -> bool:
@@ -72,12 +218,25 @@ class Option(tk.BaseModel):  # pyright: ignore[reportUntypedBaseClass]
         If optional `last_update` is provided, check for updates that were made
         after this moment.
         """
-        q: Any = cls.updated_since(last_update).exists()
-        return model.Session.query(q).scalar()
+        last_updated = cls.last_updated()
+        if last_updated is None:
+            return False
+
+        return not last_update or last_updated > last_update
+
+    @classmethod
+    def last_updated(cls) -> datetime | None:
+        """Date of the most recent modification of any option.
+
+        Computed as `MAX(updated_at)`, which is resolved by the index on
+        `updated_at` without scanning the table.
+        """
+        return model.Session.scalar(sa.select(sa.func.max(cls.updated_at)))
 
     @classmethod
     def updated_since(cls, last_update: datetime | None) -> types.Query[Self]:
-        """All overriden config options.
+        """All overriden config options, including tombstones of reset
+        options.
 
         If optional `last_update` is provided, return only options that were
         updated after this moment.
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped
+
+import ckan.plugins.toolkit as tk
+from ckan import model
+
+# the table contains exactly one row with this ID
+ROW_ID = 1
+
+
+class Revision(tk.BaseModel):  # pyright: ignore[reportUntypedBaseClass]
+    """Monotonically increasing counter of config modifications.
+
+    Every write into `editable_config_option` bumps the counter, so it's
+    enough to compare a single integer in order to detect that overrides were
+    changed.
+
+    """
+
+    __table__ = sa.Table(
+        "editable_config_revision",
+        tk.BaseModel.metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("value", sa.BigInteger, nullable=False),
+    )
+
+    id: Mapped[int]
+    value: Mapped[int]
+
+    @classmethod
+    def current(cls) -> int:
+        """Return the current revision."""
+        table = cls.__table__
+        stmt = sa.select(table.c.value).where(table.c.id == ROW_ID)
+        return model.Session.scalar(stmt) or 0
+
+    @classmethod
+    def bump(cls) -> int:
+        """Increment the revision and return its new value.
+
+        Change is not committed, so it becomes visible to other processes
+        together with the rest of the current transaction.
+
+        """
+        table = cls.__table__
+        stmt = (
+            sa.update(table)
+            .where(table.c.id == ROW_ID)
+            .values(value=table.c.value + 1)
+            .returning(table.c.value)
+        )
+
+        value = model.Session.execute(stmt).scalar()
+        if value is None:
+            value = 1
+            model.Session.execute(sa.insert(table).values(id=ROW_ID, value=value))
+
+        return value
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import json
+import logging
+import select
+import threading
+from typing import Any, Callable, Collection, List
+
+import sqlalchemy as sa
+
+from ckan import model
+
+from . import config
+
+log = logging.getLogger(__name__)
+
+CHANNEL = "editable_config"
+
+# PostgreSQL rejects payloads longer than 8000 bytes. Longer lists of keys are
+# replaced with empty payload, which means "something has changed".
+MAX_PAYLOAD = 7999
+
+# number of seconds between checks of the stop-signal by the listener
+POLL_TIMEOUT = 5
+
+# number of seconds before re-connect attempt after listener failure
+RECONNECT_DELAY = 5
+
+Callback = Callable[[List[str]], None]
+
+
+class Notifier:
+    """Base notifier that does nothing.
+
+    When notifier is not `active`, change detection relies on polling DB.
+
+    """
+
+    active: bool = False
+
+    def notify(self, keys: Collection[str]):
+        """Inform listeners that options were modified.
+
+        Notification is delivered only after the current transaction is
+        commited.
+
+        """
+
+    def listen(self, callback: Callback):
+        """Subscribe to notifications from the current process."""
+
+    def stop(self):
+        """Unsubscribe from notifications."""
+
+
+class MemoryNotifier(Notifier):
+    """In-process notifier.
+
+    Doesn't propagate changes to other processes, so it's suitable only for
+    single-process deployments and tests.
+
+    """
+
+    active = True
+
+    def __init__(self):
+        self._callbacks: list[Callback] = []
+
+    def notify(self, keys: Collection[str]):
+        keys = list(keys)
+        sa.event.listen(
+            model.Session(),
+            "after_commit",
+            lambda _session: self._publish(keys),  # pyright: ignore
+            once=True,
+        )
+
+    def listen(self, callback: Callback):
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def stop(self):
+        self._callbacks.clear()
+
+    def _publish(self, keys: list[str]):
+        for callback in self._callbacks:
+            callback(keys)
+
+
+class PostgresNotifier(Notifier):
+    """Notifier based on PostgreSQL LISTEN/NOTIFY.
+
+    Every process starts its own listener thread on the first call of
+    `listen`. If process is forked, listener is started again in the child
+    process.
+
+    """
+
+    active = True
+
+    def __init__(self):
+        self._listener: _Listener | None = None
+
+    def notify(self, keys: Collection[str]):
+        payload = json.dumps(list(keys))
+        if len(payload.encode()) > MAX_PAYLOAD:
+            payload = ""
+
+        model.Session.execute(sa.select(sa.func.pg_notify(CHANNEL, payload)))
+
+    def listen(self, callback: Callback):
+        # threads do not survive fork, so the listener from the parent process
+        # is never alive inside the child
+        if self._listener and self._listener.is_alive():
+            return
+
+        self._listener = _Listener(callback)
+        self._listener.start()
+
+    def stop(self):
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
+
+
+class _Listener(threading.Thread):
+    """Daemon thread that waits for notifications from PostgreSQL."""
+
+    def __init__(self, callback: Callback):
+        super().__init__(name="editable-config-listener", daemon=True)
+        self._callback = callback
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                self._listen()
+            except Exception:  # noqa: BLE001
+                log.exception(
+                    "Notification listener failed. Reconnect in %s seconds",
+                    RECONNECT_DELAY,
+                )
+                self._stop_event.wait(RECONNECT_DELAY)
+
+    def _listen(self):
+        conn: Any = model.meta.engine.raw_connection()
+        try:
+            conn.set_isolation_level(0)  # autocommit
+            conn.cursor().execute(f"LISTEN {CHANNEL}")
+
+            # notifications could be missed while listener was not connected.
+            self._callback([])
+
+            while not self._stop_event.is_set():
+                if select.select([conn], [], [], POLL_TIMEOUT) == ([], [], []):
+                    continue
+
+                conn.poll()
+                while conn.notifies:
+                    payload = conn.notifies.pop(0).payload
+                    self._callback(json.loads(payload) if payload else [])
+        finally:
+            # connection is still subscribed to the channel, so it must not
+            # be returned into the pool
+            conn.invalidate()
+
+
+_notifiers: dict[str, type[Notifier]] = {
+    "none": Notifier,
+    "memory": MemoryNotifier,
+    "postgres": PostgresNotifier,
+}
+_current: tuple[str, Notifier] | None = None
+
+
+def get_notifier() -> Notifier:
+    """Return notifier configured by the application."""
+    global _current  # noqa: PLW0603
+
+    name = config.notifier()
+    if _current and _current[0] == name:
+        return _current[1]
+
+    if _current:
+        _current[1].stop()
+
+    _current = (name, _notifiers[name]())
+    return _current[1]
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Iterable
+from typing import Any, Collection
 
 import sqlalchemy as sa
+from flask import Response
 
 import ckan.plugins.toolkit as tk
 from ckan import model, plugins, types
@@ -14,31 +15,65 @@ from ckan.config.declaration.option import Flag
 from ckan.logic import clear_actions_cache
 
 from . import config, shared
+from .model import MIGRATION_HEAD
 
 log = logging.getLogger(__name__)
 ENVVAR_DISABLE = "CKANEXT_EDITABLE_CONFIG_DISABLE"
 
 
+@tk.blanket.cli
 @tk.blanket.config_declarations
 @tk.blanket.actions
 @tk.blanket.helpers
 @tk.blanket.blueprints
 @tk.blanket.auth_functions
+@tk.blanket.validators
 class EditableConfigPlugin(plugins.SingletonPlugin):
     plugins.implements(plugins.IConfigurer, inherit=True)
     plugins.implements(plugins.IConfigurable, inherit=True)
     plugins.implements(plugins.IMiddleware, inherit=True)
 
     _editable_config_enabled: bool = True
+    _skip_endpoints: frozenset[str] = frozenset()
+    _skip_paths: tuple[str, ...] = ()
+    _version_header: str = ""
 
     # IMiddleware
-    def make_middleware(self, app: types.CKANApp, config: CKANConfig) -> types.CKANApp:
-        if self._editable_config_enabled:
+    def make_middleware(
+        self,
+        app: types.CKANApp,
+        config_: CKANConfig,
+    ) -> types.CKANApp:
+        if not self._editable_config_enabled:
+            return app
+
+        if config.refresh_interval():
+            shared.refresher.start(app)
+        else:
+            self._skip_endpoints = frozenset(config.skip_endpoints())
+            self._skip_paths = tuple(config.skip_paths())
             app.before_request(self._apply_overrides)
 
+        if header := config.version_header():
+            self._version_header = header
+            app.after_request(self._add_version_header)
+
         return app
 
+    def _add_version_header(self, response: Response) -> Response:
+        revision = shared.apply_config_overrides.revision
+        if revision is not None:
+            response.headers[self._version_header] = str(revision)
+
+        return response
+
     def _apply_overrides(self):
+        request = tk.request
+        if request.endpoint in self._skip_endpoints or request.path.startswith(
+            self._skip_paths,
+        ):
+            return
+
         shared.apply_config_overrides()
 
     # IConfigurer
@@ -46,6 +81,7 @@ class EditableConfigPlugin(plugins.SingletonPlugin):
         tk.add_template_directory(config_, "templates")
         tk.add_resource("assets", "editable_config")
 
+        shared.rebuild_declaration_index()
         shared.switch_editable_flag(config.extra_editable(), True)
         shared.switch_editable_flag(config.blacklist(), False)
 
@@ -56,6 +92,8 @@ class EditableConfigPlugin(plugins.SingletonPlugin):
 
                 cd[key].flags &= ~Flag.editable
 
+            shared.rebuild_editable_index()
+
         shared.add_validators(config.additional_validators())
 
     # IConfigurable
@@ -72,31 +110,71 @@ class EditableConfigPlugin(plugins.SingletonPlugin):
         if not engine:
             return
 
+        if config.skip_startup_checks():
+            log.debug("Startup checks are disabled by %s", config.SKIP_STARTUP_CHECKS)
+
+        else:
+            editable = set(shared.iter_editable())
+            fingerprint = shared.startup_fingerprint(MIGRATION_HEAD, editable)
+
+            # migrations and conflicting overrides are checked once per
+            # deployment. When new migration is added or the list of editable
+            # options changes, fingerprint changes as well.
+            self._editable_config_enabled = (
+                shared.get_startup_marker() == fingerprint
+                or self._verify_deployment(engine, editable, fingerprint)
+            )
+
+            if not self._editable_config_enabled:
+                return
+
+        shared.apply_config_overrides()
+
+    def _verify_deployment(
+        self,
+        engine: Any,
+        editable: Collection[str],
+        fingerprint: str,
+    ) -> bool:
+        """Check migrations and config overrides from core AdminUI.
+
+        Fingerprint is saved into DB when there are no problems, so other
+        processes can skip the checks.
+        """
         inspector = sa.inspect(engine)
-        self._editable_config_enabled = inspector.has_table("editable_config_option")
-        if not self._editable_config_enabled:
+        migrated = all(
+            inspector.has_table(table)
+            for table in [
+                "editable_config_option",
+                "editable_config_revision",
+                "editable_config_history",
+            ]
+        ) and "deleted_at" in {
+            column["name"] for column in inspector.get_columns("editable_config_option")
+        }
+        if not migrated:
             log.critical(
                 "editable_config disabled because of missing migration: %s",
                 "ckan db upgrade -p editable_config",
             )
-            return
+            return False
 
         # check if there are any conflicting config overrides from core AdminUI
-        stmt = sa.select(model.SystemInfo.key)
-        legacy_modified: Iterable[str] = model.Session.scalars(stmt)
-        editable = {
-            str(op) for op in cd.iter_options() if cd[op].has_flag(Flag.editable)
-        }
-
-        if problems := (set(legacy_modified) & editable):
-            if config.convert_core_overrides():
-                clear_actions_cache()
-                shared.convert_core_overrides(problems)
-
-            else:
+        stmt = sa.select(model.SystemInfo.key).where(
+            model.SystemInfo.key.in_(editable),
+        )
+        if problems := set(model.Session.scalars(stmt)):
+            if not config.convert_core_overrides():
+                # do not save the marker, so that every process reports the
+                # problem until it's solved
                 log.warning(
                     "Modification via core AdminUI will cause undefined behavior: %s",
                     problems,
                 )
+                return True
 
-        shared.apply_config_overrides()
+            clear_actions_cache()
+            shared.convert_core_overrides(problems)
+
+        shared.set_startup_marker(fingerprint)
+        return True
@@ -1,9 +1,25 @@
 from __future__ import annotations
 
+import atexit
+import bisect
+import contextlib
 import datetime
+import fnmatch
+import functools
+import hashlib
 import logging
-from typing import Any, Iterable
+import os
+import queue
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator
+
+import flask
 import sqlalchemy as sa
+from markupsafe import Markup
+from sqlalchemy.dialects.postgresql import insert
 from typing_extensions import TypedDict
 
 import ckan.plugins.toolkit as tk
@@ -11,15 +27,51 @@ from ckan import model
 from ckan.cli import CKANConfigLoader
 from ckan.common import config_declaration as cd
 from ckan.config.declaration import Key
-from ckan.config.declaration.option import Flag
+from ckan.config.declaration.option import Annotation, Flag
 from ckan.config.declaration.option import Option as DeclaredOption
+from ckan.lib.app_globals import app_globals_from_config_details, set_app_global
+from ckan.lib.navl.dictization_functions import missing
 from ckan.plugins.core import plugins_update
 
-from . import config
+from . import config, metrics
+from .notifier import get_notifier
 
 log = logging.getLogger(__name__)
 
 
+# max number of cached string representations of option values
+VALUE_CACHE_SIZE = 1024
+
+# system_info record with fingerprint of the deployment verified on startup
+STARTUP_MARKER = "editable_config_startup_marker"
+
+# declared options indexed by string key
+_declarations: dict[str, DeclaredOption[Any]] = {}
+
+# sorted names of editable options and their positions in the declaration
+_editable_keys: list[str] = []
+_editable_positions: dict[str, int] = {}
+
+# editable options grouped by annotations of the declaration
+_editable_groups: list[tuple[str, list[str]]] = []
+
+# descriptions of options rendered as HTML
+_rendered_descriptions: dict[str, Markup] = {}
+
+# special characters of glob patterns
+_RE_GLOB = re.compile(r"[*?[]")
+
+# max number of attempts to collect signature of the config chain that is
+# modified during loading
+_MAX_CHAIN_RELOADS = 3
+
+# marker of options that must be removed from the config object
+_REMOVED = object()
+
+ChangeCallback = Callable[[str, Any], None]
+_change_callbacks: dict[str, list[ChangeCallback]] = {}
+
+
 class OptionDict(TypedDict):
     key: str
     value: str
@@ -39,8 +91,98 @@ def shorten_for_log(value: Any, width: int = 80, placeholder: str = "...") -> st
     return result
 
 
+def rebuild_declaration_index():
+    """Cache declarations of all the options.
+
+    Config declaration is re-created every time plugins are loaded, so the
+    index must be rebuilt before any modification of declared options.
+
+    """
+    _declarations.clear()
+    _declarations.update(
+        (str(key), cd[key]) for key in cd.iter_options(exclude=Flag.none())
+    )
+    _value_as_string.cache_clear()
+    _rendered_descriptions.clear()
+    rebuild_editable_index()
+
+
+def rebuild_editable_index():
+    """Cache sorted names of editable options.
+
+    Index must be rebuilt after every modification of editable-flag. Options
+    that are not iterable(ignored, experimental, internal) are never exposed.
+    """
+    positions = {
+        key: idx
+        for idx, (key, option) in enumerate(_declarations.items())
+        if option.has_flag(Flag.editable) and not option.has_flag(Flag.non_iterable())
+    }
+    _editable_keys[:] = sorted(positions)
+    _editable_positions.clear()
+    _editable_positions.update(positions)
+
+    groups: list[tuple[str, list[str]]] = []
+    title = ""
+    for member in cd._members:  # pyright: ignore[reportPrivateUsage]
+        if isinstance(member, Annotation):
+            title = str(member)
+            continue
+
+        if str(member) not in positions:
+            continue
+
+        if not groups or groups[-1][0] != title:
+            groups.append((title, []))
+        groups[-1][1].append(str(member))
+
+    _editable_groups[:] = groups
+
+
+def editable_groups() -> list[tuple[str, list[str]]]:
+    """Editable options grouped by annotations of config declaration.
+
+    Returns list of pairs: title of the group and names of its options.
+    """
+    return _editable_groups
+
+
+def iter_editable(pattern: str = "*") -> Iterator[str]:
+    """Names of editable options that match glob-pattern.
+
+    Only options that share the literal prefix with the pattern are checked,
+    and the first of them is located via binary search. Options are produced
+    in the order of declaration.
+    """
+    prefix = _RE_GLOB.split(pattern, 1)[0]
+    matches: list[str] = []
+
+    idx = bisect.bisect_left(_editable_keys, prefix)
+    while idx < len(_editable_keys) and _editable_keys[idx].startswith(prefix):
+        if fnmatch.fnmatchcase(_editable_keys[idx], pattern):
+            matches.append(_editable_keys[idx])
+        idx += 1
+
+    return iter(sorted(matches, key=_editable_positions.__getitem__))
+
+
+def sort_editable(keys: Iterable[str]) -> list[str]:
+    """Names of editable options from keys in the order of declaration.
+
+    Keys that are not produced by `iter_editable` are excluded, so the
+    result can be paginated in the same way.
+    """
+    return sorted(
+        (key for key in keys if key in _editable_positions),
+        key=_editable_positions.__getitem__,
+    )
+
+
 def get_declaration(key: str) -> DeclaredOption[Any] | None:
     """Return existing declaration or None."""
+    if option := _declarations.get(key):
+        return option
+
     if key in cd:
         return cd[Key.from_string(key)]
 
@@ -48,6 +190,20 @@ def get_declaration(key: str) -> DeclaredOption[Any] | None:
     return None
 
 
+def render_description(key: str) -> Markup:
+    """Render description of the option as HTML.
+
+    Result is cached until declarations are re-indexed.
+    """
+    if key not in _rendered_descriptions:
+        from .helpers import editable_config_option_description
+
+        text = editable_config_option_description(key) or ""
+        _rendered_descriptions[key] = tk.h.render_markdown(text, allow_html=True)
+
+    return _rendered_descriptions[key]
+
+
 def add_validators(validators: dict[str, str]):
     """Append validators to the declared options.
 
@@ -63,6 +219,8 @@ def add_validators(validators: dict[str, str]):
         if option := get_declaration(key):
             option.append_validators(names)
 
+    _value_as_string.cache_clear()
+
 
 def switch_editable_flag(keys: list[str], enable: bool):
     """Change the state of editable-flag for options."""
@@ -75,6 +233,8 @@ def switch_editable_flag(keys: list[str], enable: bool):
         else:
             option.flags &= ~Flag.editable
 
+    rebuild_editable_index()
+
 
 def convert_core_overrides(names: Iterable[str]):
     """Convert SystemInfo records into editable options."""
@@ -105,6 +265,123 @@ def convert_core_overrides(names: Iterable[str]):
     model.Session.commit()
 
 
+def get_startup_marker() -> str | None:
+    """Fingerprint of the deployment verified during application startup."""
+    return model.get_system_info(STARTUP_MARKER)
+
+
+def set_startup_marker(fingerprint: str | None):
+    """Save fingerprint of the verified deployment.
+
+    Falsy value removes the marker, so all the checks are performed during
+    the next startup.
+    """
+    table = model.system_info_table
+    if fingerprint:
+        stmt = insert(table).values(
+            key=STARTUP_MARKER,
+            value=fingerprint,
+            state=model.State.ACTIVE,
+        )
+        model.Session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.key],
+                set_={"value": stmt.excluded.value},
+            ),
+        )
+    else:
+        model.Session.execute(sa.delete(table).where(table.c.key == STARTUP_MARKER))
+
+    model.Session.commit()
+
+
+def startup_fingerprint(head: str, editable: Iterable[str]) -> str:
+    """Identify the deployment by migration revision and editable options."""
+    digest = hashlib.md5(  # noqa: S324
+        "\n".join(sorted(editable)).encode(),
+    ).hexdigest()
+    return f"{head}:{digest}"
+
+
+def validate_options(options: dict[str, Any]) -> dict[str, Any]:
+    """Validate new values of the options and return validation errors.
+
+    Only validators of the modified options and options that depend on them
+    are applied. All the options are validated in a single pass, using current
+    config values for dependencies.
+
+    """
+    dependencies = config.validation_dependencies()
+
+    keys = set(options)
+    for key in options:
+        keys.update(dependencies.get(key, []))
+
+    # Option.normalize hides validation errors, so validators are taken
+    # directly from the declaration
+    schema: dict[str, Any] = {}
+    for key in keys:
+        if option := get_declaration(key):
+            parse = option._parse_validators  # pyright: ignore[reportPrivateUsage]
+            schema[key] = parse()
+
+    data = {key: tk.config.get(key) for key in keys}
+    data.update(options)
+
+    _, errors = tk.navl_validate(data, schema)
+    return errors
+
+
+def is_hot_swappable(key: str) -> bool:
+    """Check if option can be modified without reloading plugins."""
+    if key in config.hot_swappable():
+        return True
+
+    flag = Flag.__members__.get(config.hot_swappable_flag())
+    if flag and (option := get_declaration(key)):
+        return option.has_flag(flag)
+
+    return False
+
+
+def register_change_callback(key: str, callback: ChangeCallback):
+    """Call the function every time the option is modified.
+
+    Callback receives the name of the option and its new value. Use callbacks
+    to refresh subsystems that cache value of hot-swappable options.
+
+    """
+    callbacks = _change_callbacks.setdefault(key, [])
+    if callback not in callbacks:
+        callbacks.append(callback)
+
+
+def normalize_value(key: str, value: Any) -> Any:
+    """Process the value with declared validators of the option.
+
+    If value is not valid, it's returned unchanged, just as it happens during
+    normalization of the whole config object.
+
+    """
+    option = get_declaration(key)
+    if not option:
+        return value
+
+    # Option.normalize cannot tell invalid value from the valid one, so
+    # validators are applied directly
+    parse = option._parse_validators  # pyright: ignore[reportPrivateUsage]
+    data, errors = tk.navl_validate({key: value}, {key: parse()})
+    if errors or data.get(key, missing) is missing:
+        return value
+
+    return data[key]
+
+
+# application globals keep copies of some options
+for _key in app_globals_from_config_details:
+    register_change_callback(_key, set_app_global)
+
+
 def is_editable(key: str) -> bool:
     """Check if option is editable."""
     if option := get_declaration(key):
@@ -114,7 +391,24 @@ def is_editable(key: str) -> bool:
 
 
 def value_as_string(key: str, value: Any) -> str:
-    """Convert the value into string using declared option rules."""
+    """Convert the value into string using declared option rules.
+
+    Results for hashable values are cached.
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return _str_value(key, value)
+
+    return _value_as_string(key, value)
+
+
+@functools.lru_cache(maxsize=VALUE_CACHE_SIZE, typed=True)
+def _value_as_string(key: str, value: Any) -> str:
+    return _str_value(key, value)
+
+
+def _str_value(key: str, value: Any) -> str:
     # TODO: Switch to `option.str_value(value)` once PR with this form is
     # accepted and released.
     if option := get_declaration(key):
@@ -124,6 +418,92 @@ def value_as_string(key: str, value: Any) -> str:
     return str(value)
 
 
+class _SourceConfig:
+    """Lazy snapshot of the config file.
+
+    Config file is parsed on the first access and cached. Cached snapshot is
+    replaced only when inode or modification time of any file from the
+    `use = config:...` chain changes.
+
+    """
+
+    _filename: str | None
+    _snapshot: dict[str, Any] | None
+    _signature: list[tuple[str, int, int]]
+
+    def __init__(self, filename: str | None = None):
+        self._filename = filename
+        self._snapshot = None
+        self._signature = []
+
+    @property
+    def filename(self) -> str:
+        return self._filename or tk.config["__file__"]
+
+    def get(self) -> dict[str, Any]:
+        """Return up-to-date content of the config file."""
+        if self._snapshot is None or self._is_stale():
+            self._load()
+
+        return self._snapshot or {}
+
+    def _is_stale(self) -> bool:
+        if not self._signature or self._signature[0][0] != self.filename:
+            return True
+
+        return self._signature != self._stat(f for f, _, _ in self._signature)
+
+    def _load(self):
+        # CKANConfigLoader reads the whole chain in constructor, so signature
+        # is collected before the loader is created. Modifications made while
+        # files are parsed are detected on the next access. Chain is not known
+        # before parsing, so files are loaded again if it differs from the
+        # chain that was used for the signature.
+        chain = [f for f, _, _ in self._signature] if self._signature else []
+        if not chain or chain[0] != self.filename:
+            chain = [self.filename]
+
+        with metrics.timer("source_reload_seconds"):
+            signature = self._stat(chain)
+            loader = CKANConfigLoader(self.filename)
+            for _attempt in range(_MAX_CHAIN_RELOADS):
+                actual = (
+                    loader._unwrap_config_chain(  # pyright: ignore[reportPrivateUsage]
+                        loader.config_file,
+                    )
+                )
+                if actual == chain:
+                    break
+
+                chain = actual
+                signature = self._stat(chain)
+                loader = CKANConfigLoader(self.filename)
+            else:
+                log.warning(
+                    "Config chain of %s keeps changing during loading",
+                    self.filename,
+                )
+                # the last loaded chain is not verified. Signature that
+                # matches no file forces reload on the next access.
+                signature = [(f, -1, -1) for f in chain]
+
+            log.debug("Load source config from %s", chain)
+            self._signature = signature
+            self._snapshot = loader.get_config()
+
+    def _stat(self, files: Iterable[str]) -> list[tuple[str, int, int]]:
+        result: list[tuple[str, int, int]] = []
+        for filename in files:
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                result.append((filename, 0, 0))
+            else:
+                result.append((filename, stat.st_ino, stat.st_mtime_ns))
+
+        return result
+
+
 class _Updater:
     """Callable that detects and applies config changes."""
 
@@ -134,18 +514,40 @@ class _Updater:
     # updates are relatively infrequent, it's better to do double-overrides
     # once in a while instead of constantly waiting in mutex queue.
 
-    # TODO: write bencharks for mutex vs. last updated
+    # see `tests/benchmarks` for comparison of mutex and the current strategy
     # TODO: prove that race-condition is safe here
     _last_check: datetime.datetime | None
-    _active_overrides: set[str]
+    _watermark: datetime.datetime | None
+    _next_check: float
+    _revision: int | None
+    _dirty: bool
+    _active_overrides: frozenset[str]
+    _source: _SourceConfig
+    _revalidation: threading.Lock
+    _revalidator: threading.Thread | None
+    _pending: queue.SimpleQueue[flask.Flask | None]
 
     @property
     def last_check(self):
         return self._last_check
 
+    @property
+    def revision(self) -> int | None:
+        """Revision of config overrides applied by the current process."""
+        return self._revision
+
     def __init__(self):
         self._last_check = None
-        self._active_overrides = set()
+        self._watermark = None
+        self._next_check = 0
+        self._revision = None
+        self._dirty = True
+        self._active_overrides = frozenset()
+        self._source = _SourceConfig()
+        self._revalidation = threading.Lock()
+        self._revalidator = None
+        self._pending = queue.SimpleQueue()
+        self._hooks_registered = False
 
     def __call__(self) -> int:
         """Override changed config options and remove options that do not
@@ -153,90 +555,427 @@ class _Updater:
 
         Reckon total number of modifications and reload plugins if any change
         detected.
+
+        If active notifier is configured, DB is not accessed at all until
+        notification about changes is received. Otherwise, checks are
+        performed not more often than once per `charge_timeout` seconds.
+
+        In stale-while-revalidate mode check is performed in background and
+        this method always returns 0.
         """
+        notifier = get_notifier()
+        if notifier.active:
+            notifier.listen(self.mark_dirty)
+            if not self._dirty:
+                metrics.increment("checks_skipped.notifier")
+                return 0
+
+        else:
+            now = time.monotonic()
+            if now < self._next_check:
+                metrics.increment("checks_skipped.charge_timeout")
+                return 0
+
+            interval = self._interval()
+            self._next_check = now + interval if interval else 0
+
+        if config.stale_while_revalidate():
+            self._revalidate()
+            return 0
+
+        return self.check()
+
+    def _interval(self) -> float:
+        """Number of seconds till the next check."""
+        timeout = config.charge_timeout()
+        if timeout and (jitter := config.charge_jitter()):
+            timeout += random.uniform(0, jitter)  # noqa: S311
+
+        return timeout
+
+    def _revalidate(self):
+        """Schedule the check in background unless it's already running.
+
+        Checks are performed by a single long-lived worker thread. Lock is
+        acquired here and released by the worker after the check, so at most
+        one check is pending or running at any moment. Check runs inside the
+        context of the application that handles the current request, if any.
+        """
+        if not self._revalidation.acquire(blocking=False):
+            return
+
+        app: flask.Flask | None = None
+        if flask.has_app_context():
+            app = flask.current_app._get_current_object()  # pyright: ignore
+
+        if not (self._revalidator and self._revalidator.is_alive()):
+            if not self._hooks_registered and hasattr(os, "register_at_fork"):
+                os.register_at_fork(after_in_child=self._reset_revalidation)
+                self._hooks_registered = True
+
+            self._revalidator = threading.Thread(
+                target=self._revalidation_worker,
+                name="editable-config-revalidation",
+                daemon=True,
+            )
+            self._revalidator.start()
+
+        self._pending.put(app)
+
+    def _revalidation_worker(self):
+        while True:
+            app = self._pending.get()
+            try:
+                with app.app_context() if app else contextlib.nullcontext():
+                    self.check()
+            except Exception:  # noqa: BLE001
+                log.exception("Cannot apply config overrides")
+            finally:
+                model.Session.remove()
+                self._revalidation.release()
+
+    def _reset_revalidation(self):
+        # worker does not exist inside the child process and lock may be
+        # acquired by the pending check of the parent.
+        self._revalidation = threading.Lock()
+        self._pending = queue.SimpleQueue()
+        self._revalidator = None
+
+    def check(self) -> int:
+        """Detect and apply changes immediately.
+
+        Overrides are compared only when revision of config overrides is
+        changed since the last check.
+        """
+        # reset the flag before the check, to keep notifications that arrive
+        # in the middle of it. Failed check restores the flag, so pending
+        # notification is not lost.
+        self._dirty = False
+        try:
+            return self._check()
+        except Exception:
+            self._dirty = True
+            raise
+
+    def _check(self) -> int:
+        from ckanext.editable_config.model import Revision
+
         now = datetime.datetime.utcnow()
 
-        charge_timeout = datetime.timedelta(seconds=config.charge_timeout())
-        if self._last_check and now - self._last_check < charge_timeout:
+        metrics.increment("checks")
+        metrics.increment("db_queries")
+        revision = Revision.current()
+        if revision == self._revision:
+            self._last_check = now
             return 0
 
-        count = self._apply_changes()
-        count += self._remove_keys()
+        # collect everything before modification of the config object, to
+        # minimize the time when config is partially updated. Active overrides
+        # are replaced only after successful swap, so failed check can be
+        # repeated safely.
+        active = set(self._active_overrides)
+        with metrics.timer("apply_changes_seconds"):
+            changes, watermark = self._apply_changes(active)
+
+        if self._requires_full_sync(now):
+            with metrics.timer("remove_keys_seconds"):
+                changes.update(self._remove_keys(active))
 
+        self._swap(changes)
+
+        self._active_overrides = frozenset(active)
+        self._watermark = watermark
         self._last_check = now
-        if count:
-            plugins_update()
+        self._revision = revision
+        if changes:
+            self._refresh(set(changes))
+
+        return len(changes)
+
+    def _requires_full_sync(self, now: datetime.datetime) -> bool:
+        """Check if tombstones of reset options could be purged already.
+
+        Tombstones are kept for `tombstone_ttl` seconds. If the previous check
+        happened earlier, some of reset options cannot be detected
+        incrementally.
+        """
+        if not self._last_check:
+            return True
+
+        ttl = datetime.timedelta(seconds=config.tombstone_ttl())
+        return self._last_check < now - ttl
+
+    def mark_dirty(self, keys: list[str]):
+        """Force change detection during the next call."""
+        log.debug("Config overrides modified: %s", keys)
+        self._dirty = True
+
+    def _refresh(self, keys: set[str]):
+        """Make application aware of modified options.
+
+        Plugins are reloaded only if some of modified options are not
+        hot-swappable. Hot-swappable options are already normalized by
+        `_swap`.
+
+        """
+        if cold := {key for key in keys if not is_hot_swappable(key)}:
+            log.debug("Reload plugins because of %s", cold)
+            metrics.increment("plugins_updates")
+            with metrics.timer("plugins_update_seconds"):
+                plugins_update()
+
+        for key in keys:
+            for callback in _change_callbacks.get(key, []):
+                callback(key, tk.config.get(key))
 
-        return count
+    def _swap(self, changes: dict[str, Any]):
+        """Apply all collected changes to the config object at once.
 
-    def _apply_changes(self) -> int:
-        """Override config options that were updated since last check."""
+        Changes are applied to the copy of config storage, which replaces the
+        original storage via single assignment. Concurrent threads never
+        observe partially updated config and do not need any locks.
+
+        If all the changes are hot-swappable, declared defaults are restored
+        and values are normalized in the same way as it happens during
+        plugins reload, but only for the modified options.
+
+        """
+        if not changes:
+            return
+
+        store = dict(tk.config.store)
+        for key, value in changes.items():
+            if value is _REMOVED:
+                store.pop(key, None)
+            else:
+                store[key] = value
+
+        if all(is_hot_swappable(key) for key in changes):
+            for key in changes:
+                if key not in store and (option := get_declaration(key)):
+                    store[key] = option.default
+
+                store[key] = normalize_value(key, store[key])
+
+        tk.config.store = store
+        _sync_flask_config(changes.keys(), store)
+
+    def _apply_changes(
+        self,
+        active: set[str],
+    ) -> tuple[dict[str, Any], datetime.datetime | None]:
+        """Collect config options that were updated or reset since last check.
+
+        Options are compared with the latest modification date observed by
+        the previous check, which comes from DB. Process-local time is never
+        used here, because clocks of different nodes can drift.
+
+        `active` set of overriden options is updated in place. Returns
+        collected changes and the new watermark.
+        """
         from ckanext.editable_config.model import Option
 
-        count = 0
+        changes: dict[str, Any] = {}
+        watermark = self._watermark
 
-        if Option.is_updated_since(self._last_check):
-            for option in Option.updated_since(self._last_check):
-                if not is_editable(option.key):
-                    log.debug(
-                        "Option %s was overriden but isn't editable. Skip",
-                        option.key,
-                    )
-                    continue
+        metrics.increment("db_queries")
+        if not Option.is_updated_since(watermark):
+            return changes, watermark
+
+        metrics.increment("db_queries")
+        for option in Option.updated_since(self._watermark):
+            if not watermark or option.updated_at > watermark:
+                watermark = option.updated_at
 
+            if not is_editable(option.key):
                 log.debug(
-                    "Change %s from %s to %s",
+                    "Option %s was overriden but isn't editable. Skip",
                     option.key,
-                    shorten_for_log(tk.config[option.key]),
-                    shorten_for_log(option.value),
                 )
-                tk.config[option.key] = option.value
-                count += 1
+                continue
 
-        return count
+            if option.deleted_at:
+                # options that were never applied by the current process
+                # already have the original value
+                if option.key in active:
+                    active.discard(option.key)
+                    changes[option.key] = self._reset_value(option.key)
+                    metrics.increment("keys_reset")
+                continue
 
-    def _remove_keys(self) -> int:
-        """Restore original value(using config file) for specified options."""
-        count = 0
+            log.debug(
+                "Change %s from %s to %s",
+                option.key,
+                shorten_for_log(tk.config[option.key]),
+                shorten_for_log(option.value),
+            )
+            changes[option.key] = option.value
+            active.add(option.key)
+            metrics.increment("keys_changed")
 
-        src_conf = CKANConfigLoader(tk.config["__file__"]).get_config()
+        return changes, watermark
 
-        try:
-            editable = tk.get_action("editable_config_list")({"ignore_auth": True}, {})
-        except KeyError:
-            log.debug("Do not check removed overrides because plugin is not loaded yet")
-            return 0
+    def _remove_keys(self, active: set[str]) -> dict[str, Any]:
+        """Collect original values(using config file) of reset options that
+        cannot be detected using tombstones.
 
-        current_overrides = {k for k, v in editable.items() if v["option"]}
+        `active` set of overriden options is updated in place.
+        """
+        from ckanext.editable_config.model import Option
 
-        for key in self._active_overrides - current_overrides:
-            if key in src_conf:
-                # switch to the literal value from the config file.
-                log.debug(
-                    "Reset %s from %s to %s",
-                    key,
-                    shorten_for_log(tk.config[key]),
-                    shorten_for_log(src_conf[key]),
-                )
+        metrics.increment("db_queries")
+        current_overrides = {k for k in Option.overriden_keys() if is_editable(k)}
+        changes = {key: self._reset_value(key) for key in active - current_overrides}
+        metrics.increment("keys_reset", len(changes))
 
-                tk.config[key] = src_conf[key]
-            elif key in tk.config:
-                # switch to the declared default value by removing option
-                log.debug(
-                    "Remove %s with value %s",
-                    key,
-                    shorten_for_log(tk.config[key]),
-                )
-                tk.config.pop(key)
-            else:
-                # TODO: analize if it even possible to get here
-                log.warning("Attempt to reset unknown option %s", key)
-                continue
+        active.intersection_update(current_overrides)
+        return changes
+
+    def source_value(self, key: str) -> Any:
+        """Value that option has without override.
+
+        It's either the literal value from the config file or the declared
+        default. Unlike `tk.config`, it does not depend on overrides applied
+        by the current process.
+        """
+        src_conf = self._source.get()
+        if key in src_conf:
+            return src_conf[key]
+
+        declaration = get_declaration(key)
+        return declaration.default if declaration else None
+
+    def _reset_value(self, key: str) -> Any:
+        """Original value(using config file) of the reset option."""
+        src_conf = self._source.get()
+
+        if key in src_conf:
+            # switch to the literal value from the config file.
+            log.debug(
+                "Reset %s from %s to %s",
+                key,
+                shorten_for_log(tk.config.get(key)),
+                shorten_for_log(src_conf[key]),
+            )
+            return src_conf[key]
+
+        # switch to the declared default value by removing option
+        log.debug("Remove %s with value %s", key, shorten_for_log(tk.config.get(key)))
+        return _REMOVED
+
+
+def _sync_flask_config(keys: Iterable[str], store: dict[str, Any]):
+    """Copy modified options into config of the Flask application.
+
+    CKANConfig does the same on every assignment, but storage replacement
+    bypasses it. Outside of application context there is nothing to update.
+    """
+    try:
+        app_config = flask.current_app.config
+    except RuntimeError:
+        return
+
+    for key in keys:
+        if key in store:
+            app_config[key] = store[key]
+        else:
+            app_config.pop(key, None)
 
-            count += 1
 
-        self._active_overrides = current_overrides
-        return count
+class _Refresher:
+    """Daemon thread that applies config overrides periodically.
+
+    Checks are performed inside the application context, if application is
+    passed to `start`, so Flask config is updated as well. Without it only
+    `tk.config` is refreshed.
+
+    When process forks, e.g. master process of preloading server spawns
+    workers, the thread is stopped before fork and started again inside the
+    child. The parent process does not resume refreshing, it's up to the
+    children to keep their config up to date.
+
+    """
+
+    _thread: threading.Thread | None
+    _stop_event: threading.Event
+    _app: flask.Flask | None
+    _suspended: bool
+
+    def __init__(self, updater: _Updater):
+        self._updater = updater
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._app = None
+        self._suspended = False
+        self._hooks_registered = False
+
+    def start(self, app: flask.Flask | None = None):
+        """Start refresher unless it's already running."""
+        if not self._hooks_registered:
+            if hasattr(os, "register_at_fork"):
+                os.register_at_fork(
+                    before=self._suspend,
+                    after_in_child=self._restart,
+                )
+            atexit.register(self.stop)
+            self._hooks_registered = True
+
+        if app:
+            self._app = app
+
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._stop_event,),
+            name="editable-config-refresher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop refresher and wait till the end of the current check."""
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(config.refresh_interval() + 1)
+
+        self._thread = None
+
+    def _suspend(self):
+        # the thread must not be in the middle of the check when process is
+        # forked. Flag stays set in the parent, so every child restarts it.
+        if self._thread and self._thread.is_alive():
+            self.stop()
+            self._suspended = True
+
+    def _restart(self):
+        if not self._suspended:
+            return
+
+        self._suspended = False
+
+        # connections inherited from the parent cannot be shared, but they
+        # must not be closed either, because parent may still use them
+        if engine := model.meta.engine:
+            engine.dispose(close=False)
+
+        self.start()
+
+    def _run(self, stop_event: threading.Event):
+        while not stop_event.wait(config.refresh_interval()):
+            try:
+                if self._app:
+                    with self._app.app_context():
+                        self._updater.check()
+                else:
+                    self._updater.check()
+            except Exception:  # noqa: BLE001
+                log.exception("Cannot apply config overrides")
+            finally:
+                model.Session.remove()
 
 
 apply_config_overrides = _Updater()
+refresher = _Refresher(apply_config_overrides)
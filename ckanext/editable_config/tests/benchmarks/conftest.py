@@ -0,0 +1,76 @@
+# pyright: reportPrivateUsage=false
+from __future__ import annotations
+
+import pytest
+
+from ckan import model
+from ckan.common import config_declaration as cd
+from ckan.config.declaration import Key
+from ckan.config.declaration.option import Flag
+
+from ckanext.editable_config import config, shared
+from ckanext.editable_config.model import Option, Revision
+
+PREFIX = "ckanext.editable_config.benchmark"
+
+# all declared options are hot-swappable, so benchmarks do not measure
+# plugins reload
+HOT_SWAPPABLE_FLAG = "reserved_09"
+
+
+@pytest.fixture()
+def declare_options(monkeypatch: pytest.MonkeyPatch, ckan_config):
+    """Declare the given number of editable options.
+
+    Declarations are restored after the test.
+    """
+    monkeypatch.setattr(cd, "_options", cd._options.copy())
+    monkeypatch.setattr(cd, "_members", cd._members.copy())
+    monkeypatch.setattr(cd, "_sealed", False)
+    monkeypatch.setitem(ckan_config, config.HOT_SWAPPABLE_FLAG, HOT_SWAPPABLE_FLAG)
+
+    def declare(count: int) -> list[str]:
+        keys = [f"{PREFIX}.option_{idx}" for idx in range(count)]
+        for key in keys:
+            option = cd.declare(Key.from_string(key), "default")
+            option.set_flag(Flag.editable)
+            option.set_flag(Flag[HOT_SWAPPABLE_FLAG])
+            monkeypatch.setitem(ckan_config, key, option.default)
+
+        shared.rebuild_declaration_index()
+        return keys
+
+    yield declare
+
+    monkeypatch.undo()
+    shared.rebuild_declaration_index()
+
+
+@pytest.fixture()
+def make_overrides():
+    """Override given options."""
+
+    def factory(keys: list[str]) -> list[str]:
+        Revision.bump()
+        Option.set_many({key: f"{key} value" for key in keys})
+        model.Session.commit()
+        return keys
+
+    yield factory
+
+    model.Session.query(Option).delete()
+    model.Session.commit()
+
+
+@pytest.fixture()
+def reset_updater():
+    """Return callable that forces the next check to process all overrides."""
+
+    def reset():
+        updater = shared.apply_config_overrides
+        updater._last_check = None
+        updater._watermark = None
+        updater._revision = None
+        updater._active_overrides = frozenset()
+
+    return reset
@@ -0,0 +1,145 @@
+"""Request-path overhead of the extension.
+
+Run with `make benchmark` to record a new baseline and with `make
+benchmark-compare` to compare the current code with the latest baseline.
+
+"""
+from __future__ import annotations
+
+import itertools
+import threading
+from typing import Any, Callable
+
+import pytest
+
+from ckan import model
+from ckan.tests.helpers import call_action
+
+from ckanext.editable_config import config, shared
+from ckanext.editable_config.model import Option, Revision
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = [
+    pytest.mark.usefixtures("with_plugins", "clean_db"),
+    pytest.mark.ckan_config(config.NOTIFIER, "none"),
+]
+
+SIZES = [0, 10, 500]
+
+
+@pytest.mark.benchmark(group="apply_config_overrides: unchanged")
+@pytest.mark.parametrize("count", SIZES)
+def test_unchanged(benchmark: Any, declare_options, make_overrides, count: int):
+    """Per-request cost when overrides were not modified."""
+    make_overrides(declare_options(count))
+    assert shared.apply_config_overrides() == count
+
+    assert benchmark(shared.apply_config_overrides) == 0
+
+
+@pytest.mark.benchmark(group="apply_config_overrides: changed")
+@pytest.mark.parametrize("count", SIZES)
+def test_changed(
+    benchmark: Any,
+    declare_options,
+    make_overrides,
+    reset_updater,
+    count: int,
+):
+    """Cost of the request that applies all the overrides."""
+    make_overrides(declare_options(count))
+
+    result = benchmark.pedantic(
+        shared.apply_config_overrides.check,
+        setup=reset_updater,
+        rounds=20,
+    )
+    assert result == count
+
+
+@pytest.mark.benchmark(group="editable_config_list")
+@pytest.mark.parametrize("count", SIZES)
+def test_list(benchmark: Any, declare_options, make_overrides, count: int):
+    """Listing of many declared options, half of them overriden."""
+    keys = declare_options(count)
+    make_overrides(keys[: count // 2])
+
+    result = benchmark(call_action, "editable_config_list")
+    assert len(result) >= count
+
+
+@pytest.mark.benchmark(group="editable_config_change")
+@pytest.mark.parametrize("count", [1, 10, 500])
+def test_bulk_change(benchmark: Any, declare_options, count: int):
+    """Saving of many options in a single call."""
+    keys = declare_options(count)
+    counter = itertools.count()
+
+    def setup():
+        # values are unique in every round, otherwise the change is a no-op
+        suffix = next(counter)
+        options = {key: f"{key} {suffix}" for key in keys}
+        return ("editable_config_change",), {"options": options, "apply": False}
+
+    result = benchmark.pedantic(call_action, setup=setup, rounds=20)
+    assert len(result) == count
+
+    # every round is a real write. With `--benchmark-disable` there is only
+    # one round.
+    executed = next(counter)
+    assert Revision.current() == executed
+    overrides = Option.get_many(keys)
+    assert {key: option.value for key, option in overrides.items()} == {
+        key: f"{key} {executed - 1}" for key in keys
+    }
+
+
+def _hammer(func: Callable[[], Any], threads: int = 8, calls: int = 200):
+    """Call function concurrently from multiple threads."""
+
+    def target():
+        try:
+            for _call in range(calls):
+                func()
+        finally:
+            model.Session.remove()
+
+    workers = [threading.Thread(target=target) for _thread in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+@pytest.mark.benchmark(group="strategy")
+@pytest.mark.parametrize("charge_timeout", [0, 60])
+class TestStrategy:
+    """Lock-free timestamp gate compared with serialization via mutex.
+
+    Updater doesn't use mutex: concurrent checks are idempotent, so the only
+    synchronization is the `charge_timeout` gate. With zero timeout the gate
+    is always open and every call reaches DB.
+
+    """
+
+    @pytest.fixture(autouse=True)
+    def _gate(self, monkeypatch: pytest.MonkeyPatch, ckan_config, charge_timeout):
+        monkeypatch.setitem(ckan_config, config.CHARGE_TIMEOUT, charge_timeout)
+
+    def test_timestamp(self, benchmark: Any, declare_options, make_overrides):
+        make_overrides(declare_options(10))
+        shared.apply_config_overrides()
+
+        benchmark(_hammer, shared.apply_config_overrides)
+
+    def test_mutex(self, benchmark: Any, declare_options, make_overrides):
+        make_overrides(declare_options(10))
+        shared.apply_config_overrides()
+        lock = threading.Lock()
+
+        def locked():
+            with lock:
+                return shared.apply_config_overrides()
+
+        benchmark(_hammer, locked)
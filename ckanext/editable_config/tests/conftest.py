@@ -9,6 +9,7 @@ from pytest_factoryboy import register
 from ckan import model
 from ckan.tests import factories
 from ckan.tests.helpers import call_action
+
 from ckanext.editable_config.model import Option
 from ckanext.editable_config.shared import apply_config_overrides
 
@@ -17,6 +18,10 @@ from ckanext.editable_config.shared import apply_config_overrides
 def reset_last_check():
     """Remove freezetime dates in future from config_overrides."""
     apply_config_overrides._last_check = None
+    apply_config_overrides._watermark = None
+    apply_config_overrides._next_check = 0
+    apply_config_overrides._revision = None
+    apply_config_overrides._dirty = True
 
 
 @pytest.fixture()
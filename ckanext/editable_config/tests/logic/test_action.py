@@ -1,9 +1,11 @@
 import pytest
 
 import ckan.plugins.toolkit as tk
+from ckan import model
 from ckan.tests.helpers import call_action
 
 from ckanext.editable_config import config, shared
+from ckanext.editable_config.model import History, Option
 
 
 @pytest.mark.ckan_config(config.WHITELIST, ["ckan.site_title", "ckan.site_description"])
@@ -17,6 +19,69 @@ class TestList:
         result = call_action("editable_config_list", pattern="*title")
         assert set(result) == {"ckan.site_title"}
 
+    def test_paging(self):
+        keys = list(call_action("editable_config_list"))
+
+        result = call_action("editable_config_list", limit=1)
+        assert list(result) == keys[:1]
+
+        result = call_action("editable_config_list", limit=1, offset=1)
+        assert list(result) == keys[1:2]
+
+    def test_fields(self):
+        result = call_action("editable_config_list", fields=[])
+        assert all(v == {} for v in result.values())
+
+        result = call_action("editable_config_list", fields="value")
+        assert all(set(v) == {"value"} for v in result.values())
+
+        with pytest.raises(tk.ValidationError):
+            call_action("editable_config_list", fields="hello")
+
+    @pytest.mark.usefixtures("with_autoclean")
+    def test_only_overridden(self, option_factory, faker):
+        option_factory(key="ckan.site_description", value=faker.sentence())
+
+        result = call_action("editable_config_list", only_overridden=True)
+        assert set(result) == {"ckan.site_description"}
+
+    def test_only_overridden_order(self, option_factory, faker):
+        """Overridden options are paginated in the order of declaration."""
+        option_factory(key="ckan.site_title", value=faker.sentence())
+        option_factory(key="ckan.site_description", value=faker.sentence())
+        expected = list(call_action("editable_config_list"))
+
+        result = call_action("editable_config_list", only_overridden=True)
+        assert list(result) == expected
+
+        result = call_action(
+            "editable_config_list",
+            only_overridden=True,
+            offset=1,
+            limit=1,
+        )
+        assert list(result) == expected[1:]
+
+
+@pytest.mark.usefixtures("with_plugins", "clean_db", "with_autoclean")
+class TestVersion:
+    def test_changes(self, faker):
+        """Revision grows after every modification."""
+        shared.apply_config_overrides()
+        before = call_action("editable_config_version")
+
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": faker.sentence()},
+            apply=False,
+        )
+        after = call_action("editable_config_version")
+        assert after["revision"] > before["revision"]
+        assert after["applied"] == before["applied"]
+
+        shared.apply_config_overrides()
+        assert call_action("editable_config_version")["applied"] == after["revision"]
+
 
 @pytest.mark.usefixtures("with_plugins", "clean_db", "with_autoclean")
 class TestUpdate:
@@ -49,6 +114,21 @@ class TestUpdate:
         assert ckan_config[revert_option["key"]] == revert_option["prev_value"]
         assert ckan_config[reset_option["key"]] is None
 
+    def test_atomic(self, faker, option_factory, ckan_config):
+        """Nothing is saved if any part of the update fails."""
+        initial = ckan_config["ckan.site_title"]
+
+        with pytest.raises(tk.ObjectNotFound):
+            call_action(
+                "editable_config_update",
+                change={"ckan.site_title": faker.sentence()},
+                reset=["ckan.site_about"],
+            )
+
+        assert shared.apply_config_overrides() == 0
+        assert ckan_config["ckan.site_title"] == initial
+        assert call_action("editable_config_list")["ckan.site_title"]["option"] is None
+
 
 @pytest.mark.usefixtures("with_plugins", "clean_db", "with_autoclean")
 class TestChange:
@@ -97,6 +177,42 @@ class TestChange:
             options={"ckan.datasets_per_page": 1},
         )
 
+    def test_noop(self, ckan_config, autoclean_option):
+        """Values that are already in use are not saved."""
+        revision = call_action("editable_config_version")["revision"]
+
+        result = call_action(
+            "editable_config_change",
+            options={
+                autoclean_option["key"]: autoclean_option["value"],
+                "ckan.site_description": ckan_config["ckan.site_description"],
+            },
+        )
+        assert result == {autoclean_option["key"]: autoclean_option}
+        assert call_action("editable_config_version")["revision"] == revision
+        assert not call_action(
+            "editable_config_list",
+            pattern="ckan.site_description",
+            only_overridden=True,
+        )
+
+    def test_noop_ignores_stale_config(self, ckan_config, faker):
+        """Value is compared with the source one when override is missing."""
+        title = faker.sentence()
+        call_action("editable_config_change", options={"ckan.site_title": title})
+
+        # another process removes override, but it's still in use here
+        model.Session.query(Option).delete()
+        model.Session.commit()
+        assert ckan_config["ckan.site_title"] == title
+
+        result = call_action(
+            "editable_config_change",
+            options={"ckan.site_title": title},
+        )
+        assert result["ckan.site_title"]["value"] == title
+        assert Option.get("ckan.site_title")
+
 
 @pytest.mark.usefixtures("with_plugins", "clean_db", "with_autoclean")
 class TestRevert:
@@ -129,3 +245,82 @@ class TestReset:
         assert result["ckan.site_title"]["value"] == updated
         assert result["ckan.site_title"]["prev_value"] == initial
         assert ckan_config["ckan.site_title"] == initial
+
+
+@pytest.mark.usefixtures("with_plugins", "clean_db")
+class TestHistory:
+    def test_records(self, faker):
+        """Every modification is recorded with previous override."""
+        title = faker.sentence()
+        call_action("editable_config_change", options={"ckan.site_title": title})
+        call_action("editable_config_reset", keys=["ckan.site_title"])
+
+        result = call_action("editable_config_history", key="ckan.site_title")
+        assert result["count"] == 2
+        assert [(r["prev_value"], r["value"]) for r in result["results"]] == [
+            (title, None),
+            (None, title),
+        ]
+
+    def test_noop_not_recorded(self, ckan_config):
+        """Changes that do not modify options are not recorded."""
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": ckan_config["ckan.site_title"]},
+        )
+        assert call_action("editable_config_history")["count"] == 0
+
+
+@pytest.mark.usefixtures("with_plugins", "clean_db")
+class TestRollback:
+    def test_multiple_keys(self, faker, ckan_config):
+        """Every option modified after the revision is restored."""
+        initial_about = ckan_config["ckan.site_about"]
+        title = faker.sentence()
+        call_action("editable_config_change", options={"ckan.site_title": title})
+        revision = call_action("editable_config_version")["revision"]
+
+        call_action(
+            "editable_config_change",
+            options={
+                "ckan.site_title": faker.sentence(),
+                "ckan.site_about": faker.sentence(),
+            },
+        )
+
+        result = call_action("editable_config_rollback", revision=revision)
+        assert set(result["change"]) == {"ckan.site_title"}
+        assert set(result["reset"]) == {"ckan.site_about"}
+        assert ckan_config["ckan.site_title"] == title
+        assert ckan_config["ckan.site_about"] == initial_about
+
+    def test_rollback_is_recorded(self, faker, ckan_config):
+        """Rollback can be rolled back as well."""
+        initial = ckan_config["ckan.site_title"]
+        title = faker.sentence()
+        call_action("editable_config_change", options={"ckan.site_title": title})
+        revision = call_action("editable_config_version")["revision"]
+
+        call_action("editable_config_rollback", revision=revision - 1)
+        assert ckan_config["ckan.site_title"] == initial
+
+        call_action("editable_config_rollback", revision=revision)
+        assert ckan_config["ckan.site_title"] == title
+
+    def test_missing_revision(self):
+        """Only existing revisions can be restored."""
+        with pytest.raises(tk.ValidationError):
+            call_action("editable_config_rollback", revision=100)
+
+    def test_pruned_revision(self, faker):
+        """Revisions removed from history cannot be restored."""
+        for _ in range(3):
+            call_action(
+                "editable_config_change",
+                options={"ckan.site_title": faker.sentence()},
+            )
+        History.prune(1, None, 100)
+        model.Session.commit()
+
+        with pytest.raises(tk.ValidationError):
+            call_action("editable_config_rollback", revision=1)
@@ -8,7 +8,15 @@ from ckanext.editable_config.logic import schema
 @pytest.mark.parametrize(
     ("schema", "expected"),
     [
-        (schema.editable_config_list, {"pattern": "*"}),
+        (
+            schema.editable_config_list,
+            {
+                "pattern": "*",
+                "offset": 0,
+                "fields": ["value", "option"],
+                "only_overridden": False,
+            },
+        ),
         (
             schema.editable_config_update,
             {"change": {}, "revert": [], "reset": [], "apply": True},
@@ -16,6 +24,7 @@ from ckanext.editable_config.logic import schema
         (schema.editable_config_change, {"options": {}, "apply": True}),
         (schema.editable_config_revert, {"keys": [], "apply": True}),
         (schema.editable_config_reset, {"keys": [], "apply": True}),
+        (schema.editable_config_history, {"limit": 20, "offset": 0}),
         (schema.editable_config_apply, {"removed_keys": []}),
     ],
 )
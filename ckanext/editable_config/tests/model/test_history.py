@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from ckanext.editable_config.model import History
+
+
+@pytest.mark.usefixtures("with_plugins", "clean_db")
+class TestHistory:
+    def test_record(self, autoclean_option):
+        """Previous value is taken from the current override."""
+        History.record(
+            10,
+            {autoclean_option["key"]: "new", "ckan.site_about": "about"},
+            "admin",
+        )
+        records = {record.key: record for record in History.search()}
+
+        assert records[autoclean_option["key"]].prev_value == autoclean_option["value"]
+        assert records[autoclean_option["key"]].value == "new"
+        assert records[autoclean_option["key"]].actor == "admin"
+        assert records["ckan.site_about"].prev_value is None
+
+    def test_search(self):
+        """Records are filtered by option and revision."""
+        History.record(1, {"ckan.site_title": "first", "ckan.site_about": "about"})
+        History.record(2, {"ckan.site_title": "second"})
+
+        assert [r.value for r in History.search()] == ["second", "about", "first"]
+        assert [r.value for r in History.search("ckan.site_about")] == ["about"]
+        assert [r.value for r in History.search(since=1)] == ["second"]
+
+    def test_state_at(self):
+        """State is defined only for options modified after the revision."""
+        History.record(1, {"ckan.site_title": "first"})
+        History.record(2, {"ckan.site_title": "second", "ckan.site_about": "about"})
+
+        assert History.state_at(2) == {}
+        assert History.state_at(1) == {"ckan.site_title": None, "ckan.site_about": None}
+
+    def test_prune_keep(self):
+        """Only the latest records of every option are kept."""
+        for revision in range(1, 4):
+            History.record(revision, {"ckan.site_title": str(revision)})
+        History.record(4, {"ckan.site_about": "about"})
+
+        assert History.prune(2, None, 100) == 1
+        assert History.horizon() == 1
+        assert [r.revision for r in History.search()] == [4, 3, 2]
+
+    def test_prune_batches(self):
+        """Records are removed in batches."""
+        for revision in range(1, 6):
+            History.record(revision, {"ckan.site_title": str(revision)})
+
+        assert History.prune(1, None, 3) == 3
+        assert History.prune(1, None, 3) == 1
+        assert History.prune(1, None, 3) == 0
+        assert History.horizon() == 4
+
+    def test_prune_before(self):
+        """Records created before the given moment are removed."""
+        History.record(1, {"ckan.site_title": "old"})
+
+        assert History.prune(0, datetime.utcnow() - timedelta(days=1), 100) == 0
+        assert History.prune(0, datetime.utcnow() + timedelta(days=1), 100) == 1
+
+    def test_prune_without_limits(self):
+        """Nothing is removed when limits are disabled."""
+        History.record(1, {"ckan.site_title": "old"})
+        assert History.prune(0, None, 100) == 0
@@ -5,6 +5,8 @@ from unittest.mock import ANY
 
 import pytest
 
+from ckan import model
+
 from ckanext.editable_config.model import Option
 
 
@@ -17,6 +19,16 @@ class TestOption:
 
         assert Option.get("ckan.site_title") is None
 
+    def test_get_many(self, faker, autoclean_option):
+        """Option.get_many returns only existing options."""
+        options = Option.get_many([autoclean_option["key"], "ckan.site_about"])
+        assert list(options) == [autoclean_option["key"]]
+        assert Option.get_many([]) == {}
+
+    def test_overriden_keys(self, autoclean_option):
+        """Option.overriden_keys returns names of all overriden options."""
+        assert Option.overriden_keys() == {autoclean_option["key"]}
+
     def test_set_undeclared(self, faker):
         """Option.set raises a KeyError for undeclared option."""
         with pytest.raises(KeyError):
@@ -52,6 +64,53 @@ class TestOption:
         assert option.value == ckan_config[key]
         assert option.prev_value == value
 
+    def test_set_many(self, faker, ckan_config, autoclean_option):
+        """Option.set_many creates and updates options using a single
+        statement.
+
+        """
+        values = {
+            autoclean_option["key"]: faker.sentence(),
+            "ckan.site_about": faker.sentence(),
+        }
+        options = {o.key: o for o in Option.set_many(values)}
+        assert {k: o.value for k, o in options.items()} == values
+        assert options["ckan.site_about"].prev_value == ckan_config["ckan.site_about"]
+        assert Option.get_many(list(values)).keys() == values.keys()
+        assert Option.set_many({}) == []
+
+    def test_revert_many(self, autoclean_option):
+        """Option.revert_many swaps current and previous values."""
+        (option,) = Option.revert_many([autoclean_option["key"]])
+        assert option.value == autoclean_option["prev_value"]
+        assert option.prev_value == autoclean_option["value"]
+        assert Option.revert_many([]) == []
+
+    def test_reset_many(self, autoclean_option):
+        """Option.reset_many replaces options with tombstones."""
+        (option,) = Option.reset_many([autoclean_option["key"]])
+        assert option.deleted_at
+        assert Option.get(autoclean_option["key"]) is None
+        assert Option.get_many([autoclean_option["key"]]) == {}
+        assert Option.overriden_keys() == set()
+        assert Option.updated_since(None).count() == 1
+
+    def test_set_reset(self, faker, autoclean_option):
+        """Option.set restores the tombstone of reset option."""
+        Option.reset_many([autoclean_option["key"]])
+        option = Option.set(autoclean_option["key"], faker.sentence())
+        assert option.deleted_at is None
+        assert Option.get(autoclean_option["key"])
+
+    def test_purge_tombstones(self, option_factory, faker):
+        """Option.purge_tombstones removes only old tombstones."""
+        with option_factory.autoclean(key="ckan.site_title", value=faker.word()):
+            pass
+
+        assert Option.purge_tombstones(datetime.utcnow() - timedelta(days=1)) == 0
+        assert Option.purge_tombstones(datetime.utcnow() + timedelta(days=1)) == 1
+        assert Option.updated_since(None).count() == 0
+
     def test_dictize(self, faker, ckan_config):
         """Option.as_dict returns dictionary with option's keys"""
         option = Option.set("ckan.site_title", faker.sentence())
@@ -68,25 +127,42 @@ class TestOption:
         assert Option.is_updated_since(datetime.utcnow() - timedelta(seconds=1))
         assert not Option.is_updated_since(datetime.utcnow() + timedelta(seconds=1))
 
-    @pytest.mark.freeze_time("2020-01-01")
-    def test_updated_since_options(self, option_factory, freezer, faker):
-        """Option.is_updated_since checks update after specific moment. If
-        moment set to None, it checks for any updates.
+    def test_last_updated(self, faker, option_factory):
+        """Option.last_updated returns the most recent modification date."""
+        assert Option.last_updated() is None
+
+        with option_factory.autoclean(key="ckan.site_title", value=faker.word()):
+            option = Option.get("ckan.site_title")
+            assert option
+            assert Option.last_updated() == option.updated_at
+
+    def test_updated_since_options(self, option_factory, faker):
+        """Option.updated_since returns options updated after specific moment.
+        If moment set to None, it returns all options.
 
         """
         assert Option.updated_since(None).count() == 0
         with option_factory.autoclean(
             key="ckan.site_description",
             value=faker.sentence(),
-        ):
+        ) as first:
             assert Option.updated_since(None).count() == 1
-            freezer.move_to("2020-02-01")
 
             with option_factory.autoclean(
                 key="ckan.site_title",
                 value=faker.sentence(),
-            ):
+            ) as second:
                 assert Option.updated_since(None).count() == 2
 
-                assert Option.updated_since(datetime(2020, 1, 10)).count() == 1
-                assert Option.updated_since(datetime(2020, 2, 10)).count() == 0
+                first_updated = datetime.fromisoformat(first["updated_at"])
+                second_updated = datetime.fromisoformat(second["updated_at"])
+                assert Option.updated_since(first_updated).count() == 1
+                assert Option.updated_since(second_updated).count() == 0
+
+    @pytest.mark.freeze_time("2020-01-01")
+    def test_db_time(self, faker):
+        """Modification date comes from DB, not from the application."""
+        option = Option.set("ckan.site_title", faker.sentence())
+        model.Session.add(option)
+        model.Session.flush()
+        assert option.updated_at > datetime(2020, 1, 2)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pytest
+
+from ckan.tests.helpers import call_action
+
+from ckanext.editable_config.model import Revision
+
+
+@pytest.mark.usefixtures("with_plugins", "clean_db", "with_autoclean")
+class TestRevision:
+    def test_bump(self):
+        """Revision.bump increments the current revision."""
+        initial = Revision.current()
+        assert Revision.bump() == initial + 1
+        assert Revision.current() == initial + 1
+
+    def test_actions_bump_revision(self, faker):
+        """Every modification of overrides moves the revision."""
+        initial = Revision.current()
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": faker.sentence()},
+        )
+        assert Revision.current() > initial
+
+        changed = Revision.current()
+        call_action("editable_config_reset", keys=["ckan.site_title"])
+        assert Revision.current() > changed
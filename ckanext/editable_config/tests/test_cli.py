@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+import pytest
+import sqlalchemy as sa
+
+from ckan import model
+from ckan.cli.cli import ckan
+from ckan.tests.helpers import call_action
+
+from ckanext.editable_config import shared
+from ckanext.editable_config.model import History, Option
+
+
+@pytest.mark.usefixtures("with_plugins", "clean_db")
+class TestPurgeTombstones:
+    def test_ttl(self, cli, option_factory, faker):
+        """Only tombstones older than TTL are removed."""
+        option = option_factory(key="ckan.site_title", value=faker.sentence())
+        call_action("editable_config_reset", keys=[option["key"]])
+
+        result = cli.invoke(ckan, ["editable-config", "purge-tombstones"])
+        assert not result.exit_code, result.output
+        assert Option.updated_since(None).count() == 1
+
+        result = cli.invoke(ckan, ["editable-config", "purge-tombstones", "--ttl", "0"])
+        assert not result.exit_code, result.output
+        assert Option.updated_since(None).count() == 0
+
+
+@pytest.mark.usefixtures("with_plugins", "clean_db")
+def test_reset_startup_marker(cli):
+    """Startup marker is removed from DB."""
+    shared.set_startup_marker("test")
+
+    result = cli.invoke(ckan, ["editable-config", "reset-startup-marker"])
+    assert not result.exit_code, result.output
+    assert shared.get_startup_marker() is None
+
+
+@pytest.mark.usefixtures("with_plugins", "clean_db")
+def test_purge_history(cli, faker):
+    """Records above the limit are removed."""
+    for _ in range(3):
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": faker.sentence()},
+        )
+
+    result = cli.invoke(
+        ckan,
+        ["editable-config", "purge-history", "--keep", "1", "--batch-size", "1"],
+    )
+    assert not result.exit_code, result.output
+    assert History.search().count() == 1
+
+
+@pytest.mark.usefixtures("with_plugins", "clean_db")
+def test_purge_history_ttl(cli, faker):
+    """Only records older than TTL are removed."""
+    call_action("editable_config_change", options={"ckan.site_title": faker.sentence()})
+    table = History.__table__
+    model.Session.execute(
+        sa.update(table).values(created_at=table.c.created_at - timedelta(days=2)),
+    )
+    model.Session.commit()
+    call_action("editable_config_change", options={"ckan.site_about": faker.sentence()})
+
+    result = cli.invoke(
+        ckan,
+        ["editable-config", "purge-history", "--keep", "0", "--ttl", "86400"],
+    )
+    assert not result.exit_code, result.output
+    assert [record.key for record in History.search()] == ["ckan.site_about"]
@@ -0,0 +1,68 @@
+import pytest
+
+from ckan.tests.helpers import call_action
+
+from ckanext.editable_config import config, metrics, shared
+
+
+class CustomSink(metrics.Sink):
+    pass
+
+
+class TestGetSink:
+    def test_default(self):
+        assert type(metrics.get_sink()) is metrics.Sink
+
+    @pytest.mark.ckan_config(config.METRICS, f"{__name__}:CustomSink")
+    def test_import_path(self):
+        assert isinstance(metrics.get_sink(), CustomSink)
+
+    @pytest.mark.ckan_config(config.METRICS, f"{__name__}:MissingSink")
+    def test_invalid_import_path(self):
+        assert type(metrics.get_sink()) is metrics.Sink
+
+
+@pytest.mark.ckan_config(config.METRICS, "memory")
+@pytest.mark.usefixtures("with_plugins", "clean_db", "with_autoclean")
+class TestMetrics:
+    @pytest.fixture()
+    def sink(self):
+        sink = metrics.get_sink()
+        assert isinstance(sink, metrics.MemorySink)
+        sink.reset()
+        return sink
+
+    def test_check(self, sink, faker):
+        """Checks, queries and changed keys are counted."""
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": faker.sentence()},
+            apply=False,
+        )
+        sink.reset()
+
+        assert shared.apply_config_overrides() == 1
+        assert sink.counters["checks"] == 1
+        assert sink.counters["keys_changed"] == 1
+        assert sink.counters["db_queries"] >= 3
+        assert len(sink.observations["apply_changes_seconds"]) == 1
+
+    @pytest.mark.ckan_config(config.CHARGE_TIMEOUT, 10)
+    def test_charge_timeout(self, sink):
+        """Calls ignored because of charge_timeout are counted."""
+        shared.apply_config_overrides()
+        shared.apply_config_overrides()
+        assert sink.counters["checks"] == 1
+        assert sink.counters["checks_skipped.charge_timeout"] == 1
+
+    @pytest.mark.ckan_config(config.HOT_SWAPPABLE, [])
+    def test_plugins_update(self, sink, faker):
+        """Plugins reloads are counted and timed."""
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": faker.sentence()},
+            apply=False,
+        )
+        shared.apply_config_overrides()
+        assert sink.counters["plugins_updates"] == 1
+        assert len(sink.observations["plugins_update_seconds"]) == 1
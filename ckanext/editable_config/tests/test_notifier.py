@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+
+from ckanext.editable_config import notifier
+
+
+class FakeConnection:
+    """Raw DB connection that delivers predefined notifications."""
+
+    def __init__(self, payloads: list[str], fail: bool = False):
+        self.payloads = payloads
+        self.fail = fail
+        self.notifies: list[mock.Mock] = []
+        self.invalidated = False
+
+    def set_isolation_level(self, level: int):
+        if self.fail:
+            raise ConnectionError
+
+    def cursor(self):
+        return mock.Mock()
+
+    def poll(self):
+        self.notifies.extend(mock.Mock(payload=payload) for payload in self.payloads)
+        self.payloads = []
+
+    def invalidate(self):
+        self.invalidated = True
+
+
+@pytest.fixture()
+def connect(monkeypatch):
+    """Replace DB connections used by listener."""
+    raw_connection = mock.Mock()
+    monkeypatch.setattr(
+        notifier.model.meta,
+        "engine",
+        mock.Mock(raw_connection=raw_connection),
+    )
+    monkeypatch.setattr(notifier.select, "select", lambda *args: ([1], [], []))
+    monkeypatch.setattr(notifier, "RECONNECT_DELAY", 0)
+    return raw_connection
+
+
+def make_listener(expected_calls: int) -> tuple[notifier._Listener, list[list[str]]]:
+    """Listener that stops after the expected number of callback calls."""
+    calls: list[list[str]] = []
+
+    def callback(keys: list[str]):
+        calls.append(keys)
+        if len(calls) == expected_calls:
+            listener.stop()
+
+    listener = notifier._Listener(callback)
+    return listener, calls
+
+
+class TestPostgresNotifier:
+    def _payload(self, execute: mock.Mock) -> str:
+        stmt = execute.call_args.args[0]
+        _channel, payload = stmt.compile().params.values()
+        return payload
+
+    def test_payload(self, monkeypatch):
+        """Names of modified options are sent as JSON list."""
+        execute = mock.Mock()
+        monkeypatch.setattr(notifier.model.Session, "execute", execute)
+
+        notifier.PostgresNotifier().notify(["ckan.site_title"])
+        assert json.loads(self._payload(execute)) == ["ckan.site_title"]
+
+    def test_long_payload(self, monkeypatch):
+        """Payload that exceeds PostgreSQL limit is replaced with empty one."""
+        execute = mock.Mock()
+        monkeypatch.setattr(notifier.model.Session, "execute", execute)
+
+        notifier.PostgresNotifier().notify(["x" * notifier.MAX_PAYLOAD])
+        assert not self._payload(execute)
+
+
+class TestListener:
+    def test_payload_handling(self, connect):
+        """Payloads are converted into lists of keys."""
+        conn = FakeConnection(['["ckan.site_title"]', ""])
+        connect.return_value = conn
+        listener, calls = make_listener(3)
+
+        listener.run()
+
+        # the first call reports notifications missed before connection
+        assert calls == [[], ["ckan.site_title"], []]
+        assert conn.invalidated
+
+    def test_reconnect(self, connect):
+        """Listener reconnects after the connection is dropped."""
+        broken = FakeConnection([], fail=True)
+        conn = FakeConnection(['["ckan.site_title"]'])
+        connect.side_effect = [broken, conn]
+        listener, calls = make_listener(2)
+
+        listener.run()
+
+        assert connect.call_count == 2
+        assert broken.invalidated
+        assert calls == [[], ["ckan.site_title"]]
@@ -0,0 +1,101 @@
+import os
+from unittest import mock
+
+import pytest
+from alembic.script import ScriptDirectory
+
+import ckan.plugins.toolkit as tk
+from ckan import model, plugins
+
+import ckanext.editable_config
+from ckanext.editable_config import config, plugin, shared
+from ckanext.editable_config.model import MIGRATION_HEAD
+
+
+@pytest.mark.ckan_config(config.SKIP_PATHS, "/api/i18n/")
+@pytest.mark.usefixtures("with_plugins", "clean_db")
+class TestSkipRequests:
+    def test_skip_paths(self, app, monkeypatch):
+        """Requests with excluded path prefix do not trigger change detection."""
+        updater = mock.Mock(return_value=0)
+        monkeypatch.setattr(shared, "apply_config_overrides", updater)
+
+        app.get("/api/i18n/en")
+        updater.assert_not_called()
+
+        app.get("/api/action/status_show")
+        updater.assert_called_once()
+
+    def test_skip_endpoints(self, app, monkeypatch):
+        """Requests to excluded endpoints do not trigger change detection."""
+        updater = mock.Mock(return_value=0)
+        monkeypatch.setattr(shared, "apply_config_overrides", updater)
+
+        app.get("/base/css/main.css")
+        updater.assert_not_called()
+
+
+@pytest.mark.ckan_config(config.VERSION_HEADER, "X-Editable-Config-Version")
+@pytest.mark.usefixtures("with_plugins", "clean_db")
+def test_version_header(app):
+    """Revision applied by the process is added to response headers."""
+    resp = app.get("/api/action/status_show")
+    assert resp.headers["X-Editable-Config-Version"] == str(
+        shared.apply_config_overrides.revision,
+    )
+
+
+def test_migration_head():
+    """Fingerprint of the deployment uses the latest migration."""
+    path = os.path.join(
+        os.path.dirname(ckanext.editable_config.__file__),
+        "migration",
+        "editable_config",
+    )
+    assert ScriptDirectory(path).get_current_head() == MIGRATION_HEAD
+
+
+@pytest.mark.usefixtures("with_plugins", "clean_db")
+class TestStartupChecks:
+    def fingerprint(self):
+        return shared.startup_fingerprint(MIGRATION_HEAD, shared.iter_editable())
+
+    def test_marker_saved(self):
+        """Verified deployment is marked in DB."""
+        assert shared.get_startup_marker() is None
+
+        plugins.get_plugin("editable_config").configure(tk.config)
+        assert shared.get_startup_marker() == self.fingerprint()
+
+    def test_marker_skips_checks(self, monkeypatch):
+        """Schema is not inspected when deployment is already verified."""
+        shared.set_startup_marker(self.fingerprint())
+        inspect = mock.Mock()
+        monkeypatch.setattr(plugin.sa, "inspect", inspect)
+
+        plugins.get_plugin("editable_config").configure(tk.config)
+        inspect.assert_not_called()
+
+    def test_outdated_marker(self):
+        """Checks are repeated when fingerprint changes."""
+        shared.set_startup_marker("outdated")
+
+        plugins.get_plugin("editable_config").configure(tk.config)
+        assert shared.get_startup_marker() == self.fingerprint()
+
+    @pytest.mark.ckan_config(config.SKIP_STARTUP_CHECKS, True)
+    def test_skip_flag(self, monkeypatch):
+        """Checks can be disabled by config option."""
+        inspect = mock.Mock()
+        monkeypatch.setattr(plugin.sa, "inspect", inspect)
+
+        plugins.get_plugin("editable_config").configure(tk.config)
+        inspect.assert_not_called()
+        assert shared.get_startup_marker() is None
+
+    def test_conflicts_not_marked(self):
+        """Deployment with conflicting core overrides is not marked."""
+        model.set_system_info("ckan.site_title", "conflict")
+
+        plugins.get_plugin("editable_config").configure(tk.config)
+        assert shared.get_startup_marker() is None
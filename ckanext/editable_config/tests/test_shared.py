@@ -1,12 +1,20 @@
-from datetime import timedelta
+import os
+import time
+from datetime import datetime, timedelta
 from typing import get_type_hints
+from unittest import mock
 
 import pytest
 
+from ckan import model
+from ckan.common import config_declaration as cd
+from ckan.config.declaration import Key
+from ckan.config.declaration.option import Flag
+from ckan.lib.app_globals import app_globals
 from ckan.tests.helpers import call_action
 
-from ckanext.editable_config import config, shared
-from ckanext.editable_config.model import Option
+from ckanext.editable_config import config, notifier, shared
+from ckanext.editable_config.model import Option, Revision
 
 
 def test_optional_dict_is_up_to_date(faker):
@@ -22,6 +30,161 @@ def test_value_as_string():
     assert shared.value_as_string("ckan.plugins", ["hello", "world"]) == "hello world"
 
 
+@pytest.mark.usefixtures("with_plugins")
+def test_declaration_index():
+    """Declarations are taken from the index."""
+    option = shared.get_declaration("ckan.site_title")
+    assert option is cd[Key.from_string("ckan.site_title")]
+    assert shared._declarations["ckan.site_title"] is option
+
+
+@pytest.mark.usefixtures("with_plugins")
+def test_iter_editable():
+    """Editable options are filtered by glob-pattern and keep declaration
+    order.
+
+    """
+    expected = [
+        str(key)
+        for key in cd.iter_options(pattern="ckan.site_*")
+        if cd[key].has_flag(Flag.editable)
+    ]
+    assert list(shared.iter_editable("ckan.site_*")) == expected
+    assert list(shared.iter_editable("*site_title")) == ["ckan.site_title"]
+    assert list(shared.iter_editable("ckan.site_title")) == ["ckan.site_title"]
+    assert list(shared.iter_editable("ckan.site_url")) == []
+
+
+@pytest.mark.usefixtures("with_plugins")
+def test_iter_editable_skips_non_iterable(monkeypatch):
+    """Internal, experimental and ignored options are not listed."""
+    option = cd[Key.from_string("ckan.site_title")]
+    monkeypatch.setattr(option, "flags", option.flags | Flag.internal)
+    shared.rebuild_editable_index()
+    try:
+        assert "ckan.site_title" not in shared.iter_editable()
+    finally:
+        monkeypatch.undo()
+        shared.rebuild_editable_index()
+
+
+@pytest.mark.usefixtures("with_plugins")
+def test_editable_groups():
+    """Every editable option belongs to exactly one group."""
+    keys = [key for _title, group in shared.editable_groups() for key in group]
+    assert sorted(keys) == sorted(shared.iter_editable())
+
+
+@pytest.mark.usefixtures("with_plugins")
+def test_render_description():
+    """Rendered descriptions are cached until declarations are re-indexed."""
+    html = shared.render_description("ckan.site_title")
+    assert html
+    assert shared.render_description("ckan.site_title") is html
+
+    shared.rebuild_declaration_index()
+    assert shared.render_description("ckan.site_title") is not html
+
+
+@pytest.mark.usefixtures("with_plugins")
+def test_value_as_string_cache():
+    """String representation of hashable values is cached."""
+    shared.value_as_string("ckan.site_title", 123)
+    hits = shared._value_as_string.cache_info().hits
+
+    assert shared.value_as_string("ckan.site_title", 123) == "123"
+    assert shared._value_as_string.cache_info().hits == hits + 1
+
+    assert shared.value_as_string("ckan.site_title", True) == "True"
+
+
+@pytest.mark.usefixtures("with_plugins")
+class TestValidateOptions:
+    def test_valid(self):
+        assert shared.validate_options({"ckan.datasets_per_page": "10"}) == {}
+
+    def test_invalid(self):
+        errors = shared.validate_options({"ckan.datasets_per_page": "hello"})
+        assert list(errors) == ["ckan.datasets_per_page"]
+
+    @pytest.mark.ckan_config("ckan.datasets_per_page", "hello")
+    def test_unrelated_options_ignored(self, faker):
+        """Only modified options are validated."""
+        assert shared.validate_options({"ckan.site_title": faker.sentence()}) == {}
+
+    @pytest.mark.ckan_config("ckan.datasets_per_page", "hello")
+    @pytest.mark.ckan_config(
+        config.VALIDATION_DEPENDENCIES,
+        {"ckan.site_title": "ckan.datasets_per_page"},
+    )
+    def test_dependencies(self, faker):
+        """Dependencies are validated together with the modified option."""
+        errors = shared.validate_options({"ckan.site_title": faker.sentence()})
+        assert list(errors) == ["ckan.datasets_per_page"]
+
+
+class TestSourceConfig:
+    def _bump_mtime(self, path):
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_snapshot_is_cached(self, tmp_path):
+        """Config file is parsed only once while it's not modified."""
+        path = tmp_path / "ckan.ini"
+        path.write_text("[app:main]\nckan.site_title = first\n")
+
+        source = shared._SourceConfig(str(path))
+        snapshot = source.get()
+
+        assert snapshot["ckan.site_title"] == "first"
+        assert source.get() is snapshot
+
+    def test_snapshot_reloaded(self, tmp_path):
+        """Modified config file is parsed again."""
+        path = tmp_path / "ckan.ini"
+        path.write_text("[app:main]\nckan.site_title = first\n")
+        source = shared._SourceConfig(str(path))
+        source.get()
+
+        path.write_text("[app:main]\nckan.site_title = second\n")
+        self._bump_mtime(path)
+
+        assert source.get()["ckan.site_title"] == "second"
+
+    def test_snapshot_tracks_chain(self, tmp_path):
+        """Modifications of the parent config file are detected."""
+        parent = tmp_path / "parent.ini"
+        parent.write_text("[app:main]\nckan.site_title = first\n")
+        path = tmp_path / "ckan.ini"
+        path.write_text("[app:main]\nuse = config:parent.ini\n")
+        source = shared._SourceConfig(str(path))
+        assert source.get()["ckan.site_title"] == "first"
+
+        parent.write_text("[app:main]\nckan.site_title = second\n")
+        self._bump_mtime(parent)
+
+        assert source.get()["ckan.site_title"] == "second"
+
+    def test_modified_during_loading(self, tmp_path, monkeypatch):
+        """Modifications made after the file was read are detected."""
+        path = tmp_path / "ckan.ini"
+        path.write_text("[app:main]\nckan.site_title = first\n")
+        loader_class = shared.CKANConfigLoader
+
+        def loader_factory(filename):
+            loader = loader_class(filename)
+            path.write_text("[app:main]\nckan.site_title = second\n")
+            self._bump_mtime(path)
+            return loader
+
+        monkeypatch.setattr(shared, "CKANConfigLoader", loader_factory)
+        source = shared._SourceConfig(str(path))
+        assert source.get()["ckan.site_title"] == "first"
+
+        monkeypatch.setattr(shared, "CKANConfigLoader", loader_class)
+        assert source.get()["ckan.site_title"] == "second"
+
+
 @pytest.mark.usefixtures("with_plugins", "clean_db")
 class TestUpdater:
     def test_apply_new_updates(self, faker, ckan_config, freezer, autoclean_option):
@@ -35,6 +198,13 @@ class TestUpdater:
         assert shared.apply_config_overrides() == 1
         assert ckan_config[key] == value
 
+    def test_same_revision(self, autoclean_option):
+        """Overrides are not compared when revision is not changed."""
+        with mock.patch.object(Option, "updated_since") as updated_since:
+            assert shared.apply_config_overrides() == 0
+
+        updated_since.assert_not_called()
+
     @pytest.mark.ckan_config(config.CHARGE_TIMEOUT, 10)
     def test_charge_timeout(self, faker, freezer, autoclean_option):
         """New updates are applied."""
@@ -50,14 +220,66 @@ class TestUpdater:
         freezer.move_to(timedelta(seconds=6))
         assert shared.apply_config_overrides() == 1
 
-    def test_apply_old_updates(self, faker, ckan_config, freezer, autoclean_option):
-        """Old updates are ignored."""
+    @pytest.mark.ckan_config(config.CHARGE_TIMEOUT, 0.5)
+    def test_fractional_charge_timeout(self, faker, freezer, autoclean_option):
+        """Charge timeout can be shorter than a second."""
+        freezer.move_to(timedelta(seconds=0.3))
+
+        call_action(
+            "editable_config_change",
+            options={autoclean_option["key"]: faker.sentence()},
+            apply=False,
+        )
+        assert shared.apply_config_overrides() == 0
+
+        freezer.move_to(timedelta(seconds=0.3))
+        assert shared.apply_config_overrides() == 1
+
+    @pytest.mark.usefixtures("with_autoclean")
+    @pytest.mark.ckan_config(config.STALE_WHILE_REVALIDATE, True)
+    def test_stale_while_revalidate(self, faker, ckan_config):
+        """Changes are applied in background."""
+        title = faker.sentence()
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": title},
+            apply=False,
+        )
+        assert shared.apply_config_overrides() == 0
+
+        # wait till the end of background check
+        with shared.apply_config_overrides._revalidation:
+            assert ckan_config["ckan.site_title"] == title
+
+    @pytest.mark.usefixtures("with_autoclean")
+    @pytest.mark.ckan_config(config.STALE_WHILE_REVALIDATE, True)
+    def test_revalidation_worker_reused(self, faker, ckan_config):
+        """All background checks are performed by the same thread."""
+        updater = shared.apply_config_overrides
+        for _attempt in range(2):
+            title = faker.sentence()
+            call_action(
+                "editable_config_change",
+                options={"ckan.site_title": title},
+                apply=False,
+            )
+            assert updater() == 0
+            worker = updater._revalidator
+
+            with updater._revalidation:
+                assert ckan_config["ckan.site_title"] == title
+
+        assert worker is updater._revalidator
+        assert worker.is_alive()
+
+    def test_clock_drift(self, faker, ckan_config, freezer, autoclean_option):
+        """Updates are applied even if clock of the writer is behind."""
         freezer.move_to(timedelta(days=-1))
         key = autoclean_option["key"]
         value = faker.sentence()
         call_action("editable_config_change", options={key: value}, apply=False)
-        assert shared.apply_config_overrides() == 0
-        assert ckan_config[key] != value
+        assert shared.apply_config_overrides() == 1
+        assert ckan_config[key] == value
 
     @pytest.mark.usefixtures("with_autoclean")
     def test_reset_configured_option(self, ckan_config, option_factory, faker):
@@ -79,3 +301,233 @@ class TestUpdater:
         call_action("editable_config_reset", keys=[key], apply=False)
         assert shared.apply_config_overrides() == 1
         assert ckan_config[key] != option["value"]
+
+    def test_reset_detected_incrementally(self, faker, ckan_config, option_factory):
+        """Tombstones of reset options are detected without full sync."""
+        key = "ckan.site_intro_text"
+        option_factory(key=key, value=faker.sentence())
+        assert shared.apply_config_overrides() == 0
+
+        call_action("editable_config_reset", keys=[key], apply=False)
+        with mock.patch.object(
+            Option,
+            "overriden_keys",
+            wraps=Option.overriden_keys,
+        ) as overriden_keys:
+            assert shared.apply_config_overrides() == 1
+
+        overriden_keys.assert_not_called()
+
+    @pytest.mark.ckan_config(config.TOMBSTONE_TTL, 60)
+    def test_full_sync_after_ttl(self, faker, ckan_config, option_factory, freezer):
+        """Reset is detected even if tombstone was purged."""
+        key = "ckan.site_intro_text"
+        option = option_factory(key=key, value=faker.sentence())
+        assert shared.apply_config_overrides() == 0
+
+        call_action("editable_config_reset", keys=[key], apply=False)
+        freezer.move_to(timedelta(seconds=61))
+        Option.purge_tombstones(datetime.utcnow())
+        model.Session.commit()
+
+        assert shared.apply_config_overrides() == 1
+        assert ckan_config[key] != option["value"]
+
+
+@pytest.mark.usefixtures("with_plugins", "clean_db", "with_autoclean")
+class TestRefresh:
+    def _change_title(self, title):
+        shared.apply_config_overrides()
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": title},
+            apply=False,
+        )
+
+    def test_hot_swap(self, faker, ckan_config):
+        """Hot-swappable options are applied without plugins reload."""
+        title = faker.sentence()
+        self._change_title(title)
+
+        with mock.patch.object(shared, "plugins_update") as plugins_update:
+            assert shared.apply_config_overrides() == 1
+
+        plugins_update.assert_not_called()
+        assert ckan_config["ckan.site_title"] == title
+        assert app_globals.site_title == title
+
+    def test_copy_on_write(self, faker, ckan_config):
+        """Config storage is replaced instead of modification in place."""
+        title = faker.sentence()
+        self._change_title(title)
+
+        store = ckan_config.store
+        original = store["ckan.site_title"]
+        assert shared.apply_config_overrides() == 1
+
+        assert ckan_config.store is not store
+        assert store["ckan.site_title"] == original
+        assert ckan_config["ckan.site_title"] == title
+
+    @pytest.mark.ckan_config(config.HOT_SWAPPABLE, [])
+    def test_plugins_reload(self, faker):
+        """Plugins are reloaded after modification of regular options."""
+        self._change_title(faker.sentence())
+
+        with mock.patch.object(shared, "plugins_update") as plugins_update:
+            assert shared.apply_config_overrides() == 1
+
+        plugins_update.assert_called_once()
+
+    def test_change_callback(self, faker):
+        """Callbacks are called when option is modified."""
+        title = faker.sentence()
+        callback = mock.Mock()
+
+        shared.register_change_callback("ckan.site_title", callback)
+        try:
+            self._change_title(title)
+            shared.apply_config_overrides()
+        finally:
+            shared._change_callbacks["ckan.site_title"].remove(callback)
+
+        callback.assert_called_once_with("ckan.site_title", title)
+
+
+@pytest.mark.ckan_config(config.NOTIFIER, "memory")
+@pytest.mark.usefixtures("with_plugins", "clean_db", "with_autoclean")
+class TestNotifier:
+    def test_no_notifications(self, faker):
+        """DB is not accessed until notification received."""
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": faker.sentence()},
+        )
+
+        with mock.patch.object(Option, "updated_since") as updated_since:
+            assert shared.apply_config_overrides() == 0
+
+        updated_since.assert_not_called()
+
+    def test_notification(self, faker, ckan_config):
+        """Notification triggers change detection."""
+        shared.apply_config_overrides()
+        title = faker.sentence()
+
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": title},
+            apply=False,
+        )
+        shared.apply_config_overrides._dirty = False
+        notifier.get_notifier().notify(["ckan.site_title"])
+        model.Session.commit()
+
+        assert shared.apply_config_overrides() == 1
+        assert ckan_config["ckan.site_title"] == title
+
+    def test_failed_check(self, faker, ckan_config):
+        """Notification is not lost when check fails."""
+        title = faker.sentence()
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": title},
+            apply=False,
+        )
+
+        with mock.patch.object(
+            Revision,
+            "current",
+            side_effect=ConnectionError,
+        ), pytest.raises(ConnectionError):
+            shared.apply_config_overrides()
+
+        assert shared.apply_config_overrides() == 1
+        assert ckan_config["ckan.site_title"] == title
+
+    @pytest.mark.ckan_config(config.STALE_WHILE_REVALIDATE, True)
+    def test_busy_revalidation(self, faker, ckan_config):
+        """Notification is kept while another check is running."""
+        title = faker.sentence()
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": title},
+            apply=False,
+        )
+
+        updater = shared.apply_config_overrides
+        with updater._revalidation:
+            assert updater() == 0
+
+        assert updater._dirty
+        assert ckan_config["ckan.site_title"] != title
+
+        updater()
+        # wait till the end of background check
+        with updater._revalidation:
+            assert ckan_config["ckan.site_title"] == title
+            assert not updater._dirty
+
+
+@pytest.mark.ckan_config(config.REFRESH_INTERVAL, 0.1)
+@pytest.mark.usefixtures("with_plugins", "clean_db", "with_autoclean")
+class TestRefresher:
+    def test_changes_applied(self, faker, ckan_config):
+        """Refresher applies changes in background."""
+        title = faker.sentence()
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": title},
+            apply=False,
+        )
+
+        refresher = shared._Refresher(shared.apply_config_overrides)
+        refresher.start()
+        try:
+            for _attempt in range(50):
+                if ckan_config["ckan.site_title"] == title:
+                    break
+                time.sleep(0.1)
+        finally:
+            refresher.stop()
+
+        assert ckan_config["ckan.site_title"] == title
+
+    def test_fork(self, monkeypatch):
+        """Thread is stopped before fork and restarted inside the child."""
+        engine = mock.Mock()
+        monkeypatch.setattr(model.meta, "engine", engine)
+
+        refresher = shared._Refresher(shared.apply_config_overrides)
+        refresher.start()
+        try:
+            refresher._suspend()
+            assert refresher._thread is None
+
+            refresher._restart()
+            engine.dispose.assert_called_once_with(close=False)
+            assert refresher._thread
+            assert refresher._thread.is_alive()
+        finally:
+            refresher.stop()
+
+    def test_app_context(self, app, faker):
+        """Flask config is refreshed when application is available."""
+        title = faker.sentence()
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": title},
+            apply=False,
+        )
+
+        refresher = shared._Refresher(shared.apply_config_overrides)
+        refresher.start(app.flask_app)
+        try:
+            for _attempt in range(50):
+                if app.flask_app.config.get("ckan.site_title") == title:
+                    break
+                time.sleep(0.1)
+        finally:
+            refresher.stop()
+
+        assert app.flask_app.config["ckan.site_title"] == title
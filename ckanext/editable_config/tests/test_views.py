@@ -0,0 +1,103 @@
+import pytest
+
+from ckan.tests import factories
+from ckan.tests.helpers import call_action
+
+from ckanext.editable_config import shared, views
+
+
+@pytest.mark.usefixtures("with_plugins", "clean_db", "with_autoclean")
+class TestConfigView:
+    def test_conditional_get(self, app, faker):
+        """Unchanged page is not rendered again."""
+        url = "/ckan-admin/editable-config"
+        user = factories.SysadminWithToken()
+        headers = {"Authorization": user["token"]}
+
+        resp = app.get(url, headers=headers)
+        etag = resp.headers["ETag"]
+
+        resp = app.get(url, headers=dict(headers, **{"If-None-Match": etag}))
+        assert resp.status_code == 304
+
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": faker.sentence()},
+        )
+        resp = app.get(url, headers=dict(headers, **{"If-None-Match": etag}))
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+
+    def test_etag_uses_applied_revision(self, app, faker, ckan_config):
+        """Changes are applied before the page identifier is computed."""
+        url = "/ckan-admin/editable-config"
+        user = factories.SysadminWithToken()
+        headers = {"Authorization": user["token"]}
+
+        etag = app.get(url, headers=headers).headers["ETag"]
+        title = faker.sentence()
+        call_action(
+            "editable_config_change",
+            options={"ckan.site_title": title},
+            apply=False,
+        )
+
+        resp = app.get(url, headers=dict(headers, **{"If-None-Match": etag}))
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+        assert ckan_config["ckan.site_title"] == title
+
+    def test_etag_depends_on_session(self, app):
+        """Page with CSRF token from another session is not reused."""
+        url = "/ckan-admin/editable-config"
+        user = factories.SysadminWithToken()
+        headers = {"Authorization": user["token"]}
+
+        etag = app.get(url, headers=headers).headers["ETag"]
+        app.cookie_jar.clear()
+
+        resp = app.get(url, headers=dict(headers, **{"If-None-Match": etag}))
+        assert resp.status_code == 200
+
+    def test_etag_depends_on_deployment(self, app, monkeypatch):
+        """Page is rendered again when declarations are changed."""
+        url = "/ckan-admin/editable-config"
+        user = factories.SysadminWithToken()
+        headers = {"Authorization": user["token"]}
+
+        etag = app.get(url, headers=headers).headers["ETag"]
+        monkeypatch.setattr(views, "MIGRATION_HEAD", "changed")
+
+        resp = app.get(url, headers=dict(headers, **{"If-None-Match": etag}))
+        assert resp.status_code == 200
+
+    def test_groups_are_lazy(self, app):
+        """Fields are not rendered until the group is requested."""
+        user = factories.SysadminWithToken()
+        headers = {"Authorization": user["token"]}
+
+        resp = app.get("/ckan-admin/editable-config", headers=headers)
+        assert 'name="ckan.site_title"' not in resp.body
+
+        idx = next(
+            idx
+            for idx, (_title, keys) in enumerate(shared.editable_groups())
+            if "ckan.site_title" in keys
+        )
+        resp = app.get(
+            "/ckan-admin/editable-config/fields",
+            query_string={"group": idx},
+            headers=headers,
+        )
+        assert "ckan.site_title" in resp.json["keys"]
+        assert 'name="ckan.site_title"' in resp.json["html"]
+
+
+@pytest.mark.usefixtures("with_plugins")
+def test_all_options_are_lazy(ckan_config):
+    """Options are not fetched unless template accesses them."""
+    options = views._AllOptions()
+    assert "_options" not in vars(options)
+
+    assert "ckan.site_title" in options
+    assert options["ckan.site_title"]["value"] == ckan_config["ckan.site_title"]
@@ -1,38 +1,159 @@
 from __future__ import annotations
 
-from typing import Any
+import functools
+import hashlib
+import os
+import time
+from typing import Any, Iterator, Mapping
 
-from flask import Blueprint
+from flask import Blueprint, Response, jsonify, make_response, session
 from flask.views import MethodView
+from flask_wtf.csrf import generate_csrf
 
 import ckan.plugins.toolkit as tk
 from ckan.logic import parse_params
 
+from . import shared
+from .model import MIGRATION_HEAD
+
 bp = Blueprint("editable_config", __name__)
 
 
+def _check_access():
+    try:
+        tk.check_access("sysadmin", {})
+    except tk.NotAuthorized:
+        tk.abort(403, tk._("Need to be system administrator to administer"))
+
+
+def _group_options(idx: int) -> dict[str, Any]:
+    """Details of options from the group with the given index."""
+    groups = shared.editable_groups()
+    if not 0 <= idx < len(groups):
+        return {}
+
+    keys = groups[idx][1]
+    # options of the group usually share namespace, which makes lookup
+    # cheaper.
+    pattern = os.path.commonprefix(keys) + "*"
+    options = tk.get_action("editable_config_list")({}, {"pattern": pattern})
+    return {key: options[key] for key in keys if key in options}
+
+
+class _AllOptions(Mapping[str, Any]):
+    """Details of all editable options, fetched on the first access.
+
+    Form itself loads options group by group. This mapping is available as
+    `options` inside the template, for customized forms that iterate over
+    all options at once.
+    """
+
+    @functools.cached_property
+    def _options(self) -> dict[str, Any]:
+        return tk.get_action("editable_config_list")({}, {})
+
+    def __getitem__(self, key: str) -> Any:
+        return self._options[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._options)
+
+    def __len__(self) -> int:
+        return len(self._options)
+
+
+def fields():
+    """Rendered fields of the group of options."""
+    _check_access()
+
+    idx = tk.request.args.get("group", -1, type=int)
+    options = _group_options(idx)
+    html = tk.render(
+        "editable_config/snippets/fields.html",
+        {"options": options, "data": {}, "errors": {}},
+    )
+
+    return jsonify({"html": html, "keys": list(options)})
+
+
 class ConfigView(MethodView):
     def _check_access(self):
-        try:
-            tk.check_access("sysadmin", {})
-        except tk.NotAuthorized:
-            tk.abort(403, tk._("Need to be system administrator to administer"))
+        _check_access()
 
     def _render(self, data: dict[str, Any], error: tk.ValidationError | None = None):
-        options = tk.get_action("editable_config_list")({}, {})
+        """Render the form.
+
+        Groups of options are collapsed and their fields are loaded on
+        demand. Only groups with submitted values are rendered expanded, so
+        that errors are visible.
+        """
+        groups: list[dict[str, Any]] = []
+        for idx, (title, keys) in enumerate(shared.editable_groups()):
+            expanded = any(key in data or f"reset:{key}" in data for key in keys)
+            groups.append(
+                {
+                    "idx": idx,
+                    "title": title,
+                    "keys": keys,
+                    "options": _group_options(idx) if expanded else None,
+                },
+            )
 
         extra_vars: dict[str, Any] = {
             "data": data,
-            "options": options,
+            "groups": groups,
+            "options": _AllOptions(),
             "errors": error.error_dict if error else None,
             "error_summary": error.error_summary if error else None,
         }
 
         return tk.render("editable_config/config.html", extra_vars)
 
+    def _etag(self) -> str | None:
+        """Identifier of the page content for conditional requests.
+
+        Page depends on applied config overrides, set of editable options,
+        current session, user and language. It also contains CSRF token, that
+        expires after `WTF_CSRF_TIME_LIMIT`, so identifier changes twice per
+        this period, to keep cached forms valid.
+        """
+        if session.get("_flashes"):
+            return None
+
+        # make sure that token exists before it's rendered into the form
+        generate_csrf()
+
+        # fields are rendered from the config of the current process. Bring
+        # it up to date, so that identifier reflects the revision that is
+        # actually applied.
+        updater = shared.apply_config_overrides
+        updater.check()
+        parts = [
+            str(updater.revision),
+            shared.startup_fingerprint(MIGRATION_HEAD, shared.iter_editable()),
+            session.get(tk.config["WTF_CSRF_FIELD_NAME"], ""),
+            tk.current_user.name,
+            tk.h.lang(),
+        ]
+        if limit := tk.config.get("WTF_CSRF_TIME_LIMIT"):
+            parts.append(str(int(time.time() // (limit / 2))))
+
+        return hashlib.md5("|".join(parts).encode()).hexdigest()  # noqa: S324
+
     def get(self):
         self._check_access()
-        return self._render({})
+
+        etag = self._etag()
+        if etag and etag in tk.request.if_none_match:
+            resp = Response(status=304)
+        else:
+            resp = make_response(self._render({}))
+
+        if etag:
+            resp.set_etag(etag)
+            resp.headers["Cache-Control"] = "private, no-cache"
+
+        return resp
 
     def post(self):
         self._check_access()
@@ -51,7 +172,12 @@ class ConfigView(MethodView):
                     continue
                 change[key] = data[key]
 
+        if not change and not reset:
+            return tk.redirect_to("editable_config.config")
+
         try:
+            # values that match the current state of options are ignored by
+            # the action, so unchanged form doesn't cause any writes.
             tk.get_action("editable_config_update")(
                 {},
                 {"change": change, "reset": reset},
@@ -63,3 +189,4 @@ class ConfigView(MethodView):
 
 
 bp.add_url_rule("/ckan-admin/editable-config", view_func=ConfigView.as_view("config"))
+bp.add_url_rule("/ckan-admin/editable-config/fields", view_func=fields)